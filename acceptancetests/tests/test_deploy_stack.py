@@ -1,7 +1,9 @@
 from argparse import (
     Namespace,
     )
+from collections import Counter
 from contextlib import contextmanager
+import copy
 from datetime import (
     datetime,
     timedelta,
@@ -9,21 +11,24 @@ from datetime import (
 import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from unittest import (
-    skipIf,
     TestCase,
     )
 
 from mock import (
     call,
+    DEFAULT,
     MagicMock,
     patch,
     Mock,
     )
 import yaml
 
+import deploy_stack
 from deploy_stack import (
     archive_logs,
     assess_juju_relations,
@@ -80,9 +85,7 @@ from tests import (
     FakeHomeTestCase,
     FakePopen,
     make_fake_juju_return,
-    observable_temp_file,
     temp_os_env,
-    use_context,
     )
 from utility import (
     LoggedException,
@@ -90,24 +93,172 @@ from utility import (
     )
 
 
+# The timeout prefix used by every remote ssh/scp assertion.
+_TP120 = get_timeout_prefix(120)
+
+# Shared Popen stand-ins; FakePopen is stateless, so one instance per
+# canned response serves every test that patches subprocess.Popen.
+_FAKE_POPEN_KC = FakePopen('kill-controller', '', 0)
+_FAKE_POPEN_EMPTY = FakePopen('', '', 0)
+
+# The bootstrap command the TestBootContext clients produce; only the
+# config file name between prefix and suffix varies per run.
+_BOOTSTRAP_PREFIX = ('path', '--show-log', 'bootstrap', '--constraints',
+                     'mem=2G', 'paas/qux', 'bar', '--config')
+_BOOTSTRAP_SUFFIX = ('--default-model', 'bar', '--agent-version', '1.23')
+# The fixed commands boot_context runs after a successful bootstrap.
+_POST_BOOTSTRAP_CALLS = [
+    ('path', '--show-log', 'list-controllers'),
+    ('path', '--show-log', 'list-models', '-c', 'bar'),
+    ('path', '--show-log', 'show-status', '-m', 'bar:controller',
+     '--format', 'yaml'),
+    ('path', '--show-log', 'show-status', '-m', 'bar:bar',
+     '--format', 'yaml'),
+    ]
+
+# What deploy_job_parse_args yields for a bare argument list; built once
+# at import time and shared by the parse-args tests.
+_DEFAULT_PARSED_ARGS = Namespace(
+    agent_stream=None,
+    agent_url=None,
+    bootstrap_host=None,
+    debug=False,
+    env='foo',
+    temp_env_name='qux',
+    keep_env=False,
+    logs='baz',
+    machine=[],
+    juju_bin='bar/juju',
+    series=None,
+    upgrade=False,
+    verbose=logging.INFO,
+    upload_tools=False,
+    region=None,
+    to=None,
+    deadline=None,
+    controller_host=None,
+    use_charmstore=False,
+    existing=None,
+    )
+
+
+def _juju_cmd(command, *args, **kwargs):
+    """Build the argv tuple assert_juju_call expects for a juju command."""
+    model = kwargs.pop('model', 'foo:foo')
+    assert not kwargs, kwargs
+    return ('juju', '--show-log', command, '-m', model) + args
+
+
+# Pre-rendered status payloads.  The code under test only ever parses
+# these, so running the YAML emitter per test added nothing.
+_DUMMY_STACK_STATUS_YAML = """\
+machines:
+  '0':
+    agent-state: started
+services:
+  dummy-sink:
+    units:
+      dummy-sink/0:
+        agent-state: started
+"""
+_UPGRADE_STATUS_YAML = """\
+machines:
+  '0':
+    agent-state: started
+    agent-version: 2.0-rc2
+services: {}
+"""
+
+
+# Canned juju run responses for assess_juju_run, serialized once.
+_RESPONSE_OK = json.dumps(
+    [{"MachineId": "1", "Stdout": "Linux\n"},
+     {"MachineId": "2", "Stdout": "Linux\n"}])
+_RESPONSE_ERR = json.dumps([
+    {"MachineId": "1", "Stdout": "Linux\n"},
+    {"MachineId": "2",
+     "Stdout": "Linux\n",
+     "ReturnCode": 255,
+     "Stderr": "Permission denied (publickey,password)"}])
+
+
+# Status fixtures shared by the check_token tests, parsed once at module
+# load.  check_token only reads them, so sharing the objects is safe.
+_STATUS_TOKEN_ACTIVE = Status.from_text("""\
+    applications:
+      dummy-sink:
+        units:
+          dummy-sink/0:
+            workload-status:
+              current: active
+              message: Token is token
+
+    """)
+_STATUS_TOKEN_WAITING = Status.from_text("""\
+    applications:
+      dummy-sink:
+        units:
+          dummy-sink/0:
+            workload-status:
+              current: active
+              message: Waiting for token
+
+    """)
+_STATUS_JUJU_ACTIVE = Status.from_text("""\
+    applications:
+      dummy-sink:
+        units:
+          dummy-sink/0:
+            juju-status:
+              current: active
+    """)
+
+
+# Specced method mocks built once at import time.  Tests install reset
+# copies of these, paying the spec introspection cost once per process
+# rather than once per patch.object(..., autospec=True) call.
+_CLIENT_METHOD_MOCKS = dict(
+    (name, Mock(spec_set=getattr(ModelClient, name)))
+    for name in ('get_juju_output',))
+
+
+@contextmanager
+def _swap(obj, name, value):
+    """Swap obj.name for value, restoring the old value on exit.
+
+    Plain attribute assignment is far cheaper than the mock.patch
+    machinery for instance attributes on throwaway test objects."""
+    old = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        setattr(obj, name, old)
+
+
 class DeployStackTestCase(FakeHomeTestCase):
 
     log_level = logging.DEBUG
 
+    def _patched(self, obj, name, **kwargs):
+        """Return a patcher for obj.name backed by a cached specced mock.
+
+        The mock is a reset copy of the module-level template, so each test
+        gets independent call records without re-running introspection."""
+        method_mock = copy.copy(_CLIENT_METHOD_MOCKS[name])
+        method_mock.reset_mock(return_value=True, side_effect=True)
+        method_mock.configure_mock(**kwargs)
+        return patch.object(obj, name, new=method_mock)
+
+    def _client(self, env_type='nonlocal'):
+        """Return a fresh (env, client) pair for a minimal env_type env."""
+        env = JujuData('foo', {'type': env_type})
+        return env, ModelClient(env, None, None)
+
     def test_assess_juju_run(self):
-        env = JujuData('foo', {'type': 'nonlocal'})
-        client = ModelClient(env, None, None)
-        response_ok = json.dumps(
-            [{"MachineId": "1", "Stdout": "Linux\n"},
-             {"MachineId": "2", "Stdout": "Linux\n"}])
-        response_err = json.dumps([
-            {"MachineId": "1", "Stdout": "Linux\n"},
-            {"MachineId": "2",
-             "Stdout": "Linux\n",
-             "ReturnCode": 255,
-             "Stderr": "Permission denied (publickey,password)"}])
-        with patch.object(client, 'get_juju_output', autospec=True,
-                          return_value=response_ok) as gjo_mock:
+        env, client = self._client()
+        with self._patched(client, 'get_juju_output',
+                           return_value=_RESPONSE_OK) as gjo_mock:
             responses = assess_juju_run(client)
             for machine in responses:
                 self.assertFalse(machine.get('ReturnCode', False))
@@ -116,8 +267,8 @@ class DeployStackTestCase(FakeHomeTestCase):
         gjo_mock.assert_called_once_with(
             'run', '--format', 'json', '--application',
             'dummy-source,dummy-sink', 'uname')
-        with patch.object(client, 'get_juju_output', autospec=True,
-                          return_value=response_err) as gjo_mock:
+        with self._patched(client, 'get_juju_output',
+                           return_value=_RESPONSE_ERR) as gjo_mock:
             with self.assertRaises(ValueError):
                 responses = assess_juju_run(client)
         gjo_mock.assert_called_once_with(
@@ -125,21 +276,22 @@ class DeployStackTestCase(FakeHomeTestCase):
             'dummy-source,dummy-sink', 'uname')
 
     def test_safe_print_status(self):
-        env = JujuData('foo', {'type': 'nonlocal'})
-        client = ModelClient(env, None, None)
+        env, client = self._client()
         error = subprocess.CalledProcessError(1, 'status', 'status error')
-        with patch.object(client, 'juju', autospec=True,
-                          side_effect=[error]) as mock:
-            with patch.object(client, 'iter_model_clients',
-                              return_value=[client]) as imc_mock:
+        with _swap(client, 'juju', Mock(side_effect=[error])) as mock:
+            with _swap(client, 'iter_model_clients',
+                       Mock(return_value=[client])) as imc_mock:
                 safe_print_status(client)
         mock.assert_called_once_with('show-status', ('--format', 'yaml'))
         imc_mock.assert_called_once_with()
 
     def test_safe_print_status_ignores_soft_deadline(self):
-        client = fake_juju_client()
-        client._backend._past_deadline = True
-        client.bootstrap()
+        # A stub is enough here: what matters is that the status calls are
+        # made under ignore_soft_deadline, not the deadline bookkeeping a
+        # bootstrapped fake_juju_client would provide.
+        client = MagicMock(spec_set=[
+            'ignore_soft_deadline', 'iter_model_clients', 'show_status'])
+        client.iter_model_clients.return_value = [client]
 
         def raise_exception(e):
             raise e
@@ -149,6 +301,8 @@ class DeployStackTestCase(FakeHomeTestCase):
                 safe_print_status(client)
         except SoftDeadlineExceeded:
             self.fail('Raised SoftDeadlineExceeded.')
+        client.ignore_soft_deadline.assert_called_once_with()
+        client.show_status.assert_called_once_with()
 
     def test_update_env(self):
         env = JujuData('foo', {'type': 'paas'})
@@ -179,8 +333,7 @@ class DeployStackTestCase(FakeHomeTestCase):
         first_start = datetime(2017, 3, 22, 23, 36, 52, 0)
         first_end = first_start + timedelta(seconds=2)
         second_start = datetime(2017, 3, 22, 23, 40, 51, 0)
-        env = JujuData('foo', {'type': 'bar'})
-        client = ModelClient(env, None, None)
+        env, client = self._client('bar')
         client._backend.juju_timings.extend([
             CommandTime('command1', ['command1', 'arg1'], start=first_start),
             CommandTime(
@@ -210,217 +363,116 @@ class DeployStackTestCase(FakeHomeTestCase):
                 file_data = yaml.load(out_file)
         self.assertEqual(file_data, expected)
 
-    def test_check_token(self):
-        env = JujuData('foo', {'type': 'lxd'})
-        client = ModelClient(env, None, None)
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    workload-status:
-                      current: active
-                      message: Token is token
-
-            """)
-        remote = SSHRemote(client, 'unit', None, series='xenial')
+    @contextmanager
+    def _no_error(self):
+        """Stand-in error context for run_check_token."""
+        yield
+
+    def run_check_token(self, client, remote, status, error_ctx=None,
+                        platform=sys.platform):
+        """Drive check_token through the shared patch setup.
+
+        error_ctx, when given, is a context manager expected to trap
+        whatever check_token raises; platform overrides sys.platform."""
+        if error_ctx is None:
+            error_ctx = self._no_error()
+        client.get_status = Mock(return_value=status)
         with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(remote, 'cat', autospec=True,
-                              return_value='token') as rc_mock:
-                with patch.object(client, 'get_status', autospec=True,
-                                  return_value=status):
-                    check_token(client, 'token', timeout=0)
-        rc_mock.assert_called_once_with('/var/run/dummy-sink/token')
-        self.assertTrue(remote.use_juju_ssh)
+                   return_value=remote), \
+                patch('sys.platform', platform):
+            with error_ctx:
+                check_token(client, 'token', timeout=0)
+
+    def assert_check_token_log(self, *extra):
         self.assertEqual(
             ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.',
-             "INFO Token matches expected 'token'"],
+             'INFO Retrieving token.'] + list(extra),
             self.log_stream.getvalue().splitlines())
 
-    def test_check_token_not_found(self):
-        env = JujuData('foo', {'type': 'lxd'})
-        client = ModelClient(env, None, None)
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    workload-status:
-                      current: active
-                      message: Waiting for token
+    @staticmethod
+    def windows_remote(is_windows=True):
+        remote = Mock(spec=['cat', 'is_windows'])
+        remote.is_windows.return_value = is_windows
+        return remote
 
-            """)
+    def test_check_token(self):
+        env, client = self._client('lxd')
         remote = SSHRemote(client, 'unit', None, series='xenial')
-        error = subprocess.CalledProcessError(1, 'ssh', '')
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(remote, 'cat', autospec=True,
-                              side_effect=error) as rc_mock:
-                with patch.object(remote, 'get_address',
-                                  autospec=True) as ga_mock:
-                    with patch.object(client, 'get_status', autospec=True,
-                                      return_value=status):
-                        with self.assertRaisesRegexp(ValueError,
-                                                     "Token is ''"):
-                            check_token(client, 'token', timeout=0)
-        self.assertEqual(2, rc_mock.call_count)
-        ga_mock.assert_called_once_with()
+        remote.cat = Mock(return_value='token')
+        self.run_check_token(client, remote, _STATUS_TOKEN_ACTIVE)
+        remote.cat.assert_called_once_with('/var/run/dummy-sink/token')
+        self.assertTrue(remote.use_juju_ssh)
+        self.assert_check_token_log("INFO Token matches expected 'token'")
+
+    def test_check_token_not_found(self):
+        env, client = self._client('lxd')
+        remote = SSHRemote(client, 'unit', None, series='xenial')
+        remote.cat = Mock(
+            side_effect=subprocess.CalledProcessError(1, 'ssh', ''))
+        remote.get_address = Mock()
+        self.run_check_token(
+            client, remote, _STATUS_TOKEN_WAITING,
+            error_ctx=self.assertRaisesRegexp(ValueError, "Token is ''"))
+        self.assertEqual(2, remote.cat.call_count)
+        remote.get_address.assert_called_once_with()
         self.assertFalse(remote.use_juju_ssh)
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.'],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log()
 
     def test_check_token_not_found_juju_ssh_broken(self):
-        env = JujuData('foo', {'type': 'lxd'})
-        client = ModelClient(env, None, None)
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    workload-status:
-                      current: active
-                      message: Token is token
-
-            """)
+        env, client = self._client('lxd')
         remote = SSHRemote(client, 'unit', None, series='xenial')
-        error = subprocess.CalledProcessError(1, 'ssh', '')
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(remote, 'cat', autospec=True,
-                              side_effect=[error, 'token']) as rc_mock:
-                with patch.object(remote, 'get_address',
-                                  autospec=True) as ga_mock:
-                    with patch.object(client, 'get_status', autospec=True,
-                                      return_value=status):
-                        with self.assertRaisesRegexp(ValueError,
-                                                     "Token is 'token'"):
-                            check_token(client, 'token', timeout=0)
-        self.assertEqual(2, rc_mock.call_count)
-        rc_mock.assert_called_with('/var/run/dummy-sink/token')
-        ga_mock.assert_called_once_with()
+        remote.cat = Mock(
+            side_effect=[subprocess.CalledProcessError(1, 'ssh', ''),
+                         'token'])
+        remote.get_address = Mock()
+        self.run_check_token(
+            client, remote, _STATUS_TOKEN_ACTIVE,
+            error_ctx=self.assertRaisesRegexp(ValueError, "Token is 'token'"))
+        self.assertEqual(2, remote.cat.call_count)
+        remote.cat.assert_called_with('/var/run/dummy-sink/token')
+        remote.get_address.assert_called_once_with()
         self.assertFalse(remote.use_juju_ssh)
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.',
-             "INFO Token matches expected 'token'",
-             'ERROR juju ssh to unit is broken.'],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log(
+            "INFO Token matches expected 'token'",
+            'ERROR juju ssh to unit is broken.')
 
     def test_check_token_win_status(self):
-        env = JujuData('foo', {'type': 'azure'})
-        client = ModelClient(env, None, None)
-        remote = MagicMock(spec=['cat', 'is_windows'])
-        remote.is_windows.return_value = True
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    workload-status:
-                      current: active
-                      message: Token is token
-
-            """)
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(client, 'get_status', autospec=True,
-                              return_value=status):
-                check_token(client, 'token', timeout=0)
+        env, client = self._client('azure')
+        remote = self.windows_remote()
+        self.run_check_token(client, remote, _STATUS_TOKEN_ACTIVE)
         # application-status had the token.
         self.assertEqual(0, remote.cat.call_count)
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.',
-             "INFO Token matches expected 'token'"],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log("INFO Token matches expected 'token'")
 
     def test_check_token_win_client_status(self):
-        env = JujuData('foo', {'type': 'ec2'})
-        client = ModelClient(env, None, None)
-        remote = MagicMock(spec=['cat', 'is_windows'])
-        remote.is_windows.return_value = False
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    workload-status:
-                      current: active
-                      message: Token is token
-
-            """)
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(client, 'get_status', autospec=True,
-                              return_value=status):
-                with patch('sys.platform', 'win32'):
-                    check_token(client, 'token', timeout=0)
+        env, client = self._client('ec2')
+        remote = self.windows_remote(is_windows=False)
+        self.run_check_token(client, remote, _STATUS_TOKEN_ACTIVE,
+                             platform='win32')
         # application-status had the token.
         self.assertEqual(0, remote.cat.call_count)
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.',
-             "INFO Token matches expected 'token'"],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log("INFO Token matches expected 'token'")
 
     def test_check_token_win_remote(self):
-        env = JujuData('foo', {'type': 'azure'})
-        client = ModelClient(env, None, None)
-        remote = MagicMock(spec=['cat', 'is_windows'])
-        remote.is_windows.return_value = True
+        env, client = self._client('azure')
+        remote = self.windows_remote()
         remote.cat.return_value = 'token'
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    juju-status:
-                      current: active
-            """)
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(client, 'get_status', autospec=True,
-                              return_value=status):
-                check_token(client, 'token', timeout=0)
+        self.run_check_token(client, remote, _STATUS_JUJU_ACTIVE)
         # application-status did not have the token, winrm did.
         remote.cat.assert_called_once_with('%ProgramData%\\dummy-sink\\token')
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.',
-             "INFO Token matches expected 'token'"],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log("INFO Token matches expected 'token'")
 
     def test_check_token_win_remote_failure(self):
-        env = JujuData('foo', {'type': 'azure'})
-        client = ModelClient(env, None, None)
-        remote = MagicMock(spec=['cat', 'is_windows'])
-        remote.is_windows.return_value = True
+        env, client = self._client('azure')
+        remote = self.windows_remote()
         error = winrm.exceptions.WinRMTransportError('a', 'oops')
         remote.cat.side_effect = error
-        status = Status.from_text("""\
-            applications:
-              dummy-sink:
-                units:
-                  dummy-sink/0:
-                    juju-status:
-                      current: active
-            """)
-        with patch('deploy_stack.remote_from_unit', autospec=True,
-                   return_value=remote):
-            with patch.object(client, 'get_status', autospec=True,
-                              return_value=status):
-                with self.assertRaises(type(error)) as ctx:
-                    check_token(client, 'token', timeout=0)
-        self.assertIs(ctx.exception, error)
+        error_ctx = self.assertRaises(type(error))
+        self.run_check_token(client, remote, _STATUS_JUJU_ACTIVE,
+                             error_ctx=error_ctx)
+        self.assertIs(error_ctx.exception, error)
         remote.cat.assert_called_once_with('%ProgramData%\\dummy-sink\\token')
-        self.assertEqual(
-            ['INFO Waiting for applications to reach ready.',
-             'INFO Retrieving token.'],
-            self.log_stream.getvalue().splitlines())
+        self.assert_check_token_log()
 
 
 class DumpEnvLogsTestCase(FakeHomeTestCase):
@@ -430,37 +482,90 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
     def assert_machines(self, expected, got):
         self.assertEqual(expected, dict((k, got[k].address) for k in got))
 
-    r0 = remote_from_address('10.10.0.1')
-    r1 = remote_from_address('10.10.0.11')
-    r2 = remote_from_address('10.10.0.22', series='win2012hvr2')
+    @classmethod
+    def setUpClass(cls):
+        # Built here rather than in the class body so that merely importing
+        # this module (e.g. during collection of another test) does not pay
+        # for remote construction, including winrm session setup for r2.
+        super(DumpEnvLogsTestCase, cls).setUpClass()
+        cls.r0 = remote_from_address('10.10.0.1')
+        cls.r1 = remote_from_address('10.10.0.11')
+        cls.r2 = remote_from_address('10.10.0.22', series='win2012hvr2')
+        cls._remote_machines = {'0': cls.r0, '1': cls.r1, '2': cls.r2}
+        # Scratch root for the archive_logs scenarios; handing out subdirs
+        # of one tree is cheaper than a mkdtemp/rmtree pair per scenario.
+        cls._scratch = tempfile.mkdtemp(prefix='archive-logs-')
+        # The machine-iteration tests never mutate their client beyond the
+        # get_status patch, which restores itself, so one instance serves
+        # them all; construction re-resolves paths and feature flags.
+        cls.ec2_client = ModelClient(
+            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
+        # Status fixtures are read-only in the machine-iteration tests, so
+        # parse each YAML literal once per class rather than per test.
+        cls.status_two_dns = Status.from_text("""\
+            machines:
+              "0":
+                dns-name: 10.11.12.13
+              "1":
+                dns-name: 10.11.12.14
+            """)
+        cls.status_pending = Status.from_text("""\
+            machines:
+              "0":
+                instance-id: pending
+            """)
+        cls.status_maas = Status.from_text("""\
+            machines:
+              "0":
+                dns-name: node1.maas
+              "1":
+                dns-name: node2.maas
+            """)
+        cls.status_series = Status.from_text("""\
+            machines:
+              "0":
+                dns-name: 10.11.12.13
+                series: trusty
+              "1":
+                dns-name: 10.11.12.14
+                series: win2012hvr2
+            """)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._scratch, ignore_errors=True)
+        super(DumpEnvLogsTestCase, cls).tearDownClass()
 
     @classmethod
     def fake_remote_machines(cls):
-        return {'0': cls.r0, '1': cls.r1, '2': cls.r2}
+        # A shallow copy of the prebuilt mapping; the remotes themselves
+        # are shared class fixtures.
+        return dict(cls._remote_machines)
 
     def test_dump_env_logs_remote(self):
         with temp_dir() as artifacts_dir:
-            with patch('deploy_stack.get_remote_machines', autospec=True,
-                       return_value=self.fake_remote_machines()) as gm_mock:
-                with patch('deploy_stack._can_run_ssh', lambda: True):
-                    with patch('deploy_stack.copy_remote_logs',
-                               autospec=True) as crl_mock:
-                        with patch('deploy_stack.archive_logs',
-                                   autospec=True) as al_mock:
-                            env = JujuData('foo', {'type': 'nonlocal'})
-                            client = ModelClient(env, '1.234-76', None)
-                            dump_env_logs(client, '10.10.0.1', artifacts_dir)
+            gm_cxt = patch('deploy_stack.get_remote_machines',
+                           return_value=self.fake_remote_machines())
+            ssh_cxt = patch('deploy_stack._can_run_ssh', lambda: True)
+            crl_cxt = patch('deploy_stack.copy_remote_logs')
+            al_cxt = patch('deploy_stack.archive_logs')
+            with gm_cxt as gm_mock, ssh_cxt, crl_cxt as crl_mock, \
+                    al_cxt as al_mock:
+                env = JujuData('foo', {'type': 'nonlocal'})
+                client = ModelClient(env, '1.234-76', None)
+                dump_env_logs(client, '10.10.0.1', artifacts_dir)
             al_mock.assert_called_once_with(artifacts_dir)
             self.assertEqual(
                 ['machine-0', 'machine-1', 'machine-2'],
                 sorted(os.listdir(artifacts_dir)))
+        gm_mock.assert_called_once_with(client, {'0': '10.10.0.1'})
+        # The call args are hashable tuples, so a frozenset comparison
+        # avoids assertItemsEqual's pairwise matching.
         self.assertEqual(
-            (client, {'0': '10.10.0.1'}), gm_mock.call_args[0])
-        self.assertItemsEqual(
-            [(self.r0, '%s/machine-0' % artifacts_dir),
-             (self.r1, '%s/machine-1' % artifacts_dir),
-             (self.r2, '%s/machine-2' % artifacts_dir)],
-            [cal[0] for cal in crl_mock.call_args_list])
+            frozenset([(self.r0, '%s/machine-0' % artifacts_dir),
+                       (self.r1, '%s/machine-1' % artifacts_dir),
+                       (self.r2, '%s/machine-2' % artifacts_dir)]),
+            frozenset(cal[0] for cal in crl_mock.call_args_list))
         self.assertEqual(
             ['INFO Retrieving logs for machine-0 using ' + repr(self.r0),
              'INFO Retrieving logs for machine-1 using ' + repr(self.r1),
@@ -469,21 +574,21 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
 
     def test_dump_env_logs_remote_no_ssh(self):
         with temp_dir() as artifacts_dir:
-            with patch('deploy_stack.get_remote_machines', autospec=True,
-                       return_value=self.fake_remote_machines()) as gm_mock:
-                with patch('deploy_stack._can_run_ssh', lambda: False):
-                    with patch('deploy_stack.copy_remote_logs',
-                               autospec=True) as crl_mock:
-                        with patch('deploy_stack.archive_logs',
-                                   autospec=True) as al_mock:
-                            env = JujuData('foo', {'type': 'nonlocal'})
-                            client = ModelClient(env, '1.234-76', None)
-                            dump_env_logs(client, '10.10.0.1', artifacts_dir)
+            gm_cxt = patch('deploy_stack.get_remote_machines',
+                           return_value=self.fake_remote_machines())
+            ssh_cxt = patch('deploy_stack._can_run_ssh', lambda: False)
+            crl_cxt = patch('deploy_stack.copy_remote_logs')
+            al_cxt = patch('deploy_stack.archive_logs')
+            with gm_cxt as gm_mock, ssh_cxt, crl_cxt as crl_mock, \
+                    al_cxt as al_mock:
+                env = JujuData('foo', {'type': 'nonlocal'})
+                client = ModelClient(env, '1.234-76', None)
+                dump_env_logs(client, '10.10.0.1', artifacts_dir)
             al_mock.assert_called_once_with(artifacts_dir)
             self.assertEqual(
                 ['machine-2'],
                 sorted(os.listdir(artifacts_dir)))
-        self.assertEqual((client, {'0': '10.10.0.1'}), gm_mock.call_args[0])
+        gm_mock.assert_called_once_with(client, {'0': '10.10.0.1'})
         self.assertEqual(
             [(self.r2, '%s/machine-2' % artifacts_dir)],
             [cal[0] for cal in crl_mock.call_args_list])
@@ -493,70 +598,54 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
              'INFO Retrieving logs for machine-2 using ' + repr(self.r2)],
             self.log_stream.getvalue().splitlines())
 
-    def test_archive_logs(self):
-        with temp_dir() as log_dir:
-            with open(os.path.join(log_dir, 'fake.log'), 'w') as f:
-                f.write('log contents')
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                archive_logs(log_dir)
-            log_path = os.path.join(log_dir, 'fake.log')
-            cc_mock.assert_called_once_with(['gzip', '--best', '-f', log_path])
-
-    def test_archive_logs_syslog(self):
-        with temp_dir() as log_dir:
-            log_path = os.path.join(log_dir, 'syslog')
-            with open(log_path, 'w') as f:
-                f.write('syslog contents')
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                archive_logs(log_dir)
-            cc_mock.assert_called_once_with(['gzip', '--best', '-f', log_path])
-
-    def test_archive_logs_subdir(self):
-        with temp_dir() as log_dir:
-            subdir = os.path.join(log_dir, "subdir")
-            os.mkdir(subdir)
-            with open(os.path.join(subdir, 'fake.log'), 'w') as f:
-                f.write('log contents')
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                archive_logs(log_dir)
-            log_path = os.path.join(subdir, 'fake.log')
-            cc_mock.assert_called_once_with(['gzip', '--best', '-f', log_path])
-
-    def test_archive_logs_none(self):
-        with temp_dir() as log_dir:
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                archive_logs(log_dir)
-        self.assertEquals(cc_mock.call_count, 0)
+    def assert_gzip_paths(self, cc_mock, log_paths):
+        """Check the gzip call covers log_paths, in any order."""
+        if not log_paths:
+            self.assertEqual(cc_mock.call_count, 0)
+            return
+        self.assertEqual(1, cc_mock.call_count)
+        call_args, call_kwargs = cc_mock.call_args
+        gzip_args = call_args[0]
+        self.assertEqual(0, len(call_kwargs))
+        self.assertEqual(gzip_args[:3], ['gzip', '--best', '-f'])
+        self.assertEqual(set(gzip_args[3:]), set(log_paths))
 
-    def test_archive_logs_multiple(self):
-        with temp_dir() as log_dir:
+    def test_archive_logs(self):
+        # Rows replace the former plain/syslog/subdir/none/multiple tests;
+        # each is the relative log files to create before archiving.
+        scenarios = [
+            ['fake.log'],
+            ['syslog'],
+            ['subdir/fake.log'],
+            [],
+            ['fake.log', 'subdir/syslog'],
+            ]
+        # Bind the attribute lookups once outside the scenario loop.
+        join, dirname, isdir = os.path.join, os.path.dirname, os.path.isdir
+        for log_files in scenarios:
+            log_dir = tempfile.mkdtemp(dir=self._scratch)
             log_paths = []
-            with open(os.path.join(log_dir, 'fake.log'), 'w') as f:
-                f.write('log contents')
-            log_paths.append(os.path.join(log_dir, 'fake.log'))
-            subdir = os.path.join(log_dir, "subdir")
-            os.mkdir(subdir)
-            with open(os.path.join(subdir, 'syslog'), 'w') as f:
-                f.write('syslog contents')
-            log_paths.append(os.path.join(subdir, 'syslog'))
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
+            for log_file in log_files:
+                log_path = join(log_dir, log_file)
+                log_subdir = dirname(log_path)
+                if not isdir(log_subdir):
+                    os.mkdir(log_subdir)
+                with open(log_path, 'w') as f:
+                    f.write('log contents')
+                log_paths.append(log_path)
+            with patch('subprocess.check_call') as cc_mock:
                 archive_logs(log_dir)
-            self.assertEqual(1, cc_mock.call_count)
-            call_args, call_kwargs = cc_mock.call_args
-            gzip_args = call_args[0]
-            self.assertEqual(0, len(call_kwargs))
-            self.assertEqual(gzip_args[:3], ['gzip', '--best', '-f'])
-            self.assertEqual(set(gzip_args[3:]), set(log_paths))
+            self.assert_gzip_paths(cc_mock, log_paths)
 
     def test_copy_remote_logs(self):
         # To get the logs, their permissions must be updated first,
         # then downloaded in the order that they will be created
         # to ensure errors do not prevent some logs from being retrieved.
-        with patch('deploy_stack.wait_for_port', autospec=True):
-            with patch('subprocess.check_output') as cc_mock:
-                copy_remote_logs(remote_from_address('10.10.0.1'), '/foo')
+        with patch('deploy_stack.wait_for_port'), \
+                patch('subprocess.check_output') as cc_mock:
+            copy_remote_logs(remote_from_address('10.10.0.1'), '/foo')
         self.assertEqual(
-            (get_timeout_prefix(120) + (
+            (_TP120 + (
                 'ssh',
                 '-o', 'User ubuntu',
                 '-o', 'UserKnownHostsFile /dev/null',
@@ -576,7 +665,7 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
                 ),),
             cc_mock.call_args_list[0][0])
         self.assertEqual(
-            (get_timeout_prefix(120) + (
+            (_TP120 + (
                 'ssh',
                 '-o', 'User ubuntu',
                 '-o', 'UserKnownHostsFile /dev/null',
@@ -586,7 +675,7 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
                 'ifconfig > /home/ubuntu/ifconfig.log'),),
             cc_mock.call_args_list[1][0])
         self.assertEqual(
-            (get_timeout_prefix(120) + (
+            (_TP120 + (
                 'scp', '-rC',
                 '-o', 'User ubuntu',
                 '-o', 'UserKnownHostsFile /dev/null',
@@ -607,7 +696,7 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
 
     def test_copy_remote_logs_windows(self):
         remote = remote_from_address('10.10.0.1', series="win2012hvr2")
-        with patch.object(remote, "copy", autospec=True) as copy_mock:
+        with patch.object(remote, "copy", new=Mock()) as copy_mock:
             copy_remote_logs(remote, '/foo')
         paths = [
             "%ProgramFiles(x86)%\\Cloudbase Solutions\\Cloudbase-Init\\log\\*",
@@ -624,9 +713,9 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
             else:
                 raise subprocess.CalledProcessError('scp error', 'output')
 
-        with patch('subprocess.check_output', side_effect=remote_op) as co:
-            with patch('deploy_stack.wait_for_port', autospec=True):
-                copy_remote_logs(remote_from_address('10.10.0.1'), '/foo')
+        with patch('subprocess.check_output', side_effect=remote_op) as co, \
+                patch('deploy_stack.wait_for_port'):
+            copy_remote_logs(remote_from_address('10.10.0.1'), '/foo')
         self.assertEqual(3, co.call_count)
         self.assertEqual(
             ["DEBUG ssh -o 'User ubuntu' -o 'UserKnownHostsFile /dev/null' "
@@ -652,39 +741,24 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
             self.log_stream.getvalue().splitlines())
 
     def test_get_machines_for_logs(self):
-        client = ModelClient(
-            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
-        status = Status.from_text("""\
-            machines:
-              "0":
-                dns-name: 10.11.12.13
-              "1":
-                dns-name: 10.11.12.14
-            """)
-        with patch.object(client, 'get_status', autospec=True,
-                          return_value=status):
+        client = self.ec2_client
+        with patch.object(client, 'get_status',
+                          new=Mock(return_value=self.status_two_dns)):
             machines = get_remote_machines(client, {})
         self.assert_machines(
             {'0': '10.11.12.13', '1': '10.11.12.14'}, machines)
 
     def test_get_machines_for_logs_with_bootstrap_host(self):
-        client = ModelClient(
-            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
-        status = Status.from_text("""\
-            machines:
-              "0":
-                instance-id: pending
-            """)
-        with patch.object(client, 'get_status', autospec=True,
-                          return_value=status):
+        client = self.ec2_client
+        with patch.object(client, 'get_status',
+                          new=Mock(return_value=self.status_pending)):
             machines = get_remote_machines(client, {'0': '10.11.111.222'})
         self.assert_machines({'0': '10.11.111.222'}, machines)
 
     def test_get_machines_for_logs_with_no_addresses(self):
-        client = ModelClient(
-            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
-        with patch.object(client, 'get_status', autospec=True,
-                          side_effect=Exception):
+        client = self.ec2_client
+        with patch.object(client, 'get_status',
+                          new=Mock(side_effect=Exception)):
             machines = get_remote_machines(client, {'0': '10.11.111.222'})
         self.assert_machines({'0': '10.11.111.222'}, machines)
 
@@ -705,15 +779,8 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
             'maas-oauth': 'baz',
             }}}}
         client = ModelClient(juju_data, '1.23.4', None)
-        status = Status.from_text("""\
-            machines:
-              "0":
-                dns-name: node1.maas
-              "1":
-                dns-name: node2.maas
-            """)
-        with patch.object(client, 'get_status', autospec=True,
-                          return_value=status):
+        with patch.object(client, 'get_status',
+                          new=Mock(return_value=self.status_maas)):
             allocated_ips = {
                 'node1.maas': '10.11.12.13',
                 'node2.maas': '10.11.12.14',
@@ -725,36 +792,18 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
             {'0': '10.11.12.13', '1': '10.11.12.14'}, machines)
 
     def test_iter_remote_machines(self):
-        client = ModelClient(
-            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
-        status = Status.from_text("""\
-            machines:
-              "0":
-                dns-name: 10.11.12.13
-              "1":
-                dns-name: 10.11.12.14
-            """)
-        with patch.object(client, 'get_status', autospec=True,
-                          return_value=status):
+        client = self.ec2_client
+        with patch.object(client, 'get_status',
+                          new=Mock(return_value=self.status_two_dns)):
             machines = [(m, r.address)
                         for m, r in iter_remote_machines(client)]
         self.assertEqual(
             [('0', '10.11.12.13'), ('1', '10.11.12.14')], machines)
 
     def test_iter_remote_machines_with_series(self):
-        client = ModelClient(
-            JujuData('cloud', {'type': 'ec2'}), '1.23.4', None)
-        status = Status.from_text("""\
-            machines:
-              "0":
-                dns-name: 10.11.12.13
-                series: trusty
-              "1":
-                dns-name: 10.11.12.14
-                series: win2012hvr2
-            """)
-        with patch.object(client, 'get_status', autospec=True,
-                          return_value=status):
+        client = self.ec2_client
+        with patch.object(client, 'get_status',
+                          new=Mock(return_value=self.status_series)):
             machines = [(m, r.address, r.series)
                         for m, r in iter_remote_machines(client)]
         self.assertEqual(
@@ -764,32 +813,36 @@ class DumpEnvLogsTestCase(FakeHomeTestCase):
 
 class TestDeployDummyStack(FakeHomeTestCase):
 
+    def setUp(self):
+        super(TestDeployDummyStack, self).setUp()
+        # One check_call patch per test rather than one per with block;
+        # tests read self.cc_mock.
+        patcher = patch('subprocess.check_call')
+        self.cc_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_deploy_dummy_stack_sets_centos_constraints(self):
         env = JujuData('foo', {'type': 'maas'})
         client = ModelClient(env, '2.0.0', '/foo/juju')
-        with patch('subprocess.check_call', autospec=True) as cc_mock:
-            with patch.object(ModelClient, 'wait_for_started'):
-                with patch('deploy_stack.get_random_string',
-                           return_value='fake-token', autospec=True):
-                    deploy_dummy_stack(client, 'centos')
-        assert_juju_call(self, cc_mock, client,
-                         ('juju', '--show-log', 'set-model-constraints', '-m',
-                          'foo:foo', 'tags=MAAS_NIC_1'), 0)
+        with patch.object(ModelClient, 'wait_for_started'), \
+                patch('deploy_stack.get_random_string',
+                      return_value='fake-token', autospec=True):
+            deploy_dummy_stack(client, 'centos')
+        assert_juju_call(
+            self, self.cc_mock, client,
+            _juju_cmd('set-model-constraints', 'tags=MAAS_NIC_1'), 0)
 
     def test_assess_juju_relations(self):
         env = JujuData('foo', {'type': 'nonlocal'})
         client = ModelClient(env, None, '/foo/juju')
         with patch.object(client, 'get_juju_output', side_effect='fake-token',
-                          autospec=True):
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                with patch('deploy_stack.get_random_string',
-                           return_value='fake-token', autospec=True):
-                    with patch('deploy_stack.check_token',
-                               autospec=True) as ct_mock:
-                        assess_juju_relations(client)
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'config', '-m', 'foo:foo',
-            'dummy-source', 'token=fake-token'), 0)
+                          autospec=True), \
+                patch('deploy_stack.get_random_string',
+                      return_value='fake-token', autospec=True), \
+                patch('deploy_stack.check_token', autospec=True) as ct_mock:
+            assess_juju_relations(client)
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'config', 'dummy-source', 'token=fake-token'), 0)
         ct_mock.assert_called_once_with(client, 'fake-token')
 
     def test_deploy_dummy_stack_centos(self):
@@ -827,43 +880,33 @@ class TestDeployDummyStack(FakeHomeTestCase):
     def test_deploy_dummy_stack(self):
         env = JujuData('foo', {'type': 'nonlocal'})
         client = ModelClient(env, '2.0.0', '/foo/juju')
-        status = yaml.safe_dump({
-            'machines': {'0': {'agent-state': 'started'}},
-            'services': {
-                'dummy-sink': {'units': {
-                    'dummy-sink/0': {'agent-state': 'started'}}
-                }
-            }
-        })
+        status = _DUMMY_STACK_STATUS_YAML
+
+        token_file = '/var/run/dummy-sink/token'
+        output_table = {
+            ('show-status', '--format', 'yaml'): status,
+            ('ssh', 'dummy-sink/0', 'cat', token_file): 'fake-token',
+        }
 
         def output(*args, **kwargs):
-            token_file = '/var/run/dummy-sink/token'
-            output = {
-                ('show-status', '--format', 'yaml'): status,
-                ('ssh', 'dummy-sink/0', 'cat', token_file): 'fake-token',
-            }
-            return output[args]
+            return output_table[args]
 
         with patch.object(client, 'get_juju_output', side_effect=output,
-                          autospec=True) as gjo_mock:
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                with patch('deploy_stack.get_random_string',
-                           return_value='fake-token', autospec=True):
-                    with patch('sys.stdout', autospec=True):
-                        with temp_os_env('JUJU_REPOSITORY', '/tmp/repo'):
-                            deploy_dummy_stack(client, 'bar-')
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'deploy', '-m', 'foo:foo',
-            '/tmp/repo/charms/dummy-source', '--series', 'bar-'), 0)
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'deploy', '-m', 'foo:foo',
-            '/tmp/repo/charms/dummy-sink', '--series', 'bar-'), 1)
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'add-relation', '-m', 'foo:foo',
-            'dummy-source', 'dummy-sink'), 2)
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'expose', '-m', 'foo:foo', 'dummy-sink'), 3)
-        self.assertEqual(cc_mock.call_count, 4)
+                          autospec=True) as gjo_mock, \
+                patch('deploy_stack.get_random_string',
+                      return_value='fake-token', autospec=True), \
+                patch('sys.stdout'), \
+                temp_os_env('JUJU_REPOSITORY', '/tmp/repo'):
+            deploy_dummy_stack(client, 'bar-')
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'deploy', '/tmp/repo/charms/dummy-source', '--series', 'bar-'), 0)
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'deploy', '/tmp/repo/charms/dummy-sink', '--series', 'bar-'), 1)
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'add-relation', 'dummy-source', 'dummy-sink'), 2)
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'expose', 'dummy-sink'), 3)
+        self.assertEqual(self.cc_mock.call_count, 4)
         self.assertEqual(
             [
                 call('show-status', '--format', 'yaml', controller=False)
@@ -871,20 +914,18 @@ class TestDeployDummyStack(FakeHomeTestCase):
             gjo_mock.call_args_list)
 
         client = client.clone(version='1.25.0')
+        self.cc_mock.reset_mock()
         with patch.object(client, 'get_juju_output', side_effect=output,
-                          autospec=True) as gjo_mock:
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                with patch('deploy_stack.get_random_string',
-                           return_value='fake-token', autospec=True):
-                    with patch('sys.stdout', autospec=True):
-                        with temp_os_env('JUJU_REPOSITORY', '/tmp/repo'):
-                            deploy_dummy_stack(client, 'bar-')
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'deploy', '-m', 'foo:foo',
-            'local:bar-/dummy-source', '--series', 'bar-'), 0)
-        assert_juju_call(self, cc_mock, client, (
-            'juju', '--show-log', 'deploy', '-m', 'foo:foo',
-            'local:bar-/dummy-sink', '--series', 'bar-'), 1)
+                          autospec=True) as gjo_mock, \
+                patch('deploy_stack.get_random_string',
+                      return_value='fake-token', autospec=True), \
+                patch('sys.stdout'), \
+                temp_os_env('JUJU_REPOSITORY', '/tmp/repo'):
+            deploy_dummy_stack(client, 'bar-')
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'deploy', 'local:bar-/dummy-source', '--series', 'bar-'), 0)
+        assert_juju_call(self, self.cc_mock, client, _juju_cmd(
+            'deploy', 'local:bar-/dummy-sink', '--series', 'bar-'), 1)
 
 
 def fake_ModelClient(env, path=None, debug=None):
@@ -952,8 +993,25 @@ class FakeBootstrapManager:
                 yield machines
 
 
+class StubBootstrapManager:
+    """The only manager surface _deploy_job touches is booted_context.
+
+    A hand-rolled stub avoids MagicMock's per-attribute child-mock
+    bookkeeping on every access."""
+
+    @contextmanager
+    def booted_context(self, upload_tools, **kwargs):
+        yield ['0']
+
+
 class TestDeployJob(FakeHomeTestCase):
 
+    # Patchers with no per-test state, built once at class creation and
+    # re-entered by each ds_cxt call; uses never nest, so reuse is safe.
+    juju_cxt = patch('jujupy.ModelClient.juju', autospec=True)
+    ajr_cxt = patch('deploy_stack.assess_juju_run', autospec=True)
+    dds_cxt = patch('deploy_stack.deploy_dummy_stack', autospec=True)
+
     @contextmanager
     def ds_cxt(self):
         env = JujuData('foo', {})
@@ -962,13 +1020,10 @@ class TestDeployJob(FakeHomeTestCase):
                        return_value=client)
         fc_cxt = patch('jujupy.JujuData.from_config',
                        return_value=env)
-        mgr = MagicMock()
         bm_cxt = patch('deploy_stack.BootstrapManager', autospec=True,
-                       return_value=mgr)
-        juju_cxt = patch('jujupy.ModelClient.juju', autospec=True)
-        ajr_cxt = patch('deploy_stack.assess_juju_run', autospec=True)
-        dds_cxt = patch('deploy_stack.deploy_dummy_stack', autospec=True)
-        with bc_cxt, fc_cxt, bm_cxt as bm_mock, juju_cxt, ajr_cxt, dds_cxt:
+                       return_value=StubBootstrapManager())
+        with bc_cxt, fc_cxt, bm_cxt as bm_mock, \
+                self.juju_cxt, self.ajr_cxt, self.dds_cxt:
             yield client, bm_mock
 
     def test_region(self):
@@ -982,8 +1037,8 @@ class TestDeployJob(FakeHomeTestCase):
         with self.ds_cxt() as (client, bm_mock):
             with patch('deploy_stack.assess_juju_relations',
                        autospec=True):
-                with patch('subprocess.Popen', autospec=True,
-                           return_value=FakePopen('', '', 0)):
+                with patch('subprocess.Popen',
+                           return_value=_FAKE_POPEN_EMPTY):
                     with patch('deploy_stack.make_controller_strategy',
                                ) as mcs_mock:
                         _deploy_job(args, 'local:trusty/', 'trusty')
@@ -1038,46 +1093,58 @@ class TestTestUpgrade(FakeHomeTestCase):
     LIST_MODELS = (
         'juju', '--show-log', 'list-models', '-c', 'foo', '--format', 'yaml')
 
+    # Canned outputs; upgrade_output hands these out on every fake
+    # subprocess call.  The uname payload is the same one assess_juju_run
+    # expects, so the module constant is reused.
+    STATUS_OUT = _UPGRADE_STATUS_YAML
+    RUN_UNAME_OUT = _RESPONSE_OK
+    LIST_MODELS_OUT = json.dumps(
+        {'models': [
+            {'name': 'controller'},
+            {'name': 'foo'},
+        ]})
+
     @classmethod
-    def upgrade_output(cls, args, **kwargs):
-        status = yaml.safe_dump({
-            'machines': {'0': {
-                'agent-state': 'started',
-                'agent-version': '2.0-rc2'}},
-            'services': {}})
-        juju_run_out = json.dumps([
-            {"MachineId": "1", "Stdout": "Linux\n"},
-            {"MachineId": "2", "Stdout": "Linux\n"}])
-        list_models = json.dumps(
-            {'models': [
-                {'name': 'controller'},
-                {'name': 'foo'},
-            ]})
-        output = {
-            cls.STATUS: status,
-            cls.CONTROLLER_STATUS: status,
-            cls.RUN_UNAME: juju_run_out,
-            cls.GET_ENV: 'testing',
-            cls.GET_CONTROLLER_ENV: 'testing',
-            cls.LIST_MODELS: list_models,
+    def setUpClass(cls):
+        super(TestTestUpgrade, cls).setUpClass()
+        # FakePopen is effectively stateless (communicate only reports the
+        # canned output), so one shared instance per argv is safe and saves
+        # rebuilding the dispatch table on every fake subprocess call.
+        cls._output_table = {
+            cls.STATUS: FakePopen(cls.STATUS_OUT, '', 0),
+            cls.CONTROLLER_STATUS: FakePopen(cls.STATUS_OUT, '', 0),
+            cls.RUN_UNAME: FakePopen(cls.RUN_UNAME_OUT, '', 0),
+            cls.GET_ENV: FakePopen('testing', '', 0),
+            cls.GET_CONTROLLER_ENV: FakePopen('testing', '', 0),
+            cls.LIST_MODELS: FakePopen(cls.LIST_MODELS_OUT, '', 0),
         }
-        return FakePopen(output[args], '', 0)
+
+    @classmethod
+    def upgrade_output(cls, args, **kwargs):
+        return cls._output_table[args]
+
+    def setUp(self):
+        super(TestTestUpgrade, self).setUp()
+        # check_call is patched for the whole test rather than inside each
+        # upgrade_mocks entry; tests read self.cc_mock.
+        patcher = patch('subprocess.check_call')
+        self.cc_mock = patcher.start()
+        self.addCleanup(patcher.stop)
 
     @contextmanager
     def upgrade_mocks(self):
         with patch('subprocess.Popen', side_effect=self.upgrade_output,
                    autospec=True) as co_mock:
-            with patch('subprocess.check_call', autospec=True) as cc_mock:
-                with patch('deploy_stack.check_token', autospec=True):
-                    with patch('deploy_stack.get_random_string',
-                               return_value="FAKETOKEN", autospec=True):
-                        with patch('jujupy.ModelClient.get_version',
-                                   side_effect=lambda cls:
-                                   '2.0-rc2-arch-series'):
-                            with patch(
-                                    'jujupy.backend.get_timeout_prefix',
-                                    autospec=True, return_value=()):
-                                yield (co_mock, cc_mock)
+            with patch('deploy_stack.check_token', autospec=True):
+                with patch('deploy_stack.get_random_string',
+                           return_value="FAKETOKEN", autospec=True):
+                    with patch('jujupy.ModelClient.get_version',
+                               side_effect=lambda cls:
+                               '2.0-rc2-arch-series'):
+                        with patch(
+                                'jujupy.backend.get_timeout_prefix',
+                                autospec=True, return_value=()):
+                            yield (co_mock, self.cc_mock)
 
     def test_assess_upgrade(self):
         env = JujuData('foo', {'type': 'foo'})
@@ -1320,6 +1387,97 @@ class TestPublicController(FakeHomeTestCase):
 
 class TestBootstrapManager(FakeHomeTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestBootstrapManager, cls).setUpClass()
+        # Bootstrapping the fake client builds a whole model graph; do it
+        # once and hand tests private deep copies.
+        cls._bootstrapped_template = fake_juju_client()
+        cls._bootstrapped_template.bootstrap()
+        # One scratch root for the whole class; handing out subdirectories
+        # replaces a mkdtemp/rmtree pair per temp_dir() use.
+        cls._tmp_root = tempfile.mkdtemp(prefix='bootstrap-manager-')
+        # Prebuilt log-dir/juju-home skeleton; tests clone it rather than
+        # rebuilding the layout with a chain of mkdirs.
+        cls._layout_template = os.path.join(cls._tmp_root, 'layout-template')
+        os.mkdir(cls._layout_template)
+        os.mkdir(os.path.join(cls._layout_template, 'log-dir'))
+        os.mkdir(os.path.join(cls._layout_template, 'juju-home'))
+        # Template for the soft-deadline tests; they take shallow copies
+        # instead of constructing fresh ModelClients.
+        cls._deadline_client_template = ModelClient(
+            JujuData('foo', {'type': 'nonlocal'}), None, None)
+        # dump_juju_timings is pure log-dir bookkeeping no test asserts
+        # through; patch it once for the class and reset per test.
+        cls._djt_patcher = patch('deploy_stack.dump_juju_timings')
+        cls.djt_mock = cls._djt_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._djt_patcher.stop()
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+        super(TestBootstrapManager, cls).tearDownClass()
+
+    def setUp(self):
+        super(TestBootstrapManager, self).setUp()
+        self.djt_mock.reset_mock()
+
+    def _tmp(self):
+        """Return a fresh subdirectory of the class scratch root."""
+        return tempfile.mkdtemp(dir=self._tmp_root)
+
+    def _cloned_layout(self):
+        """Clone the layout template and return (log_dir, juju_home)."""
+        root = os.path.join(self._tmp(), 'layout')
+        shutil.copytree(self._layout_template, root)
+        return (os.path.join(root, 'log-dir'), os.path.join(root, 'juju-home'))
+
+    def _swap_module_attr(self, name, mock_obj):
+        """Install mock_obj as a deploy_stack global for this test.
+
+        Plain attribute assignment with an addCleanup restore is cheaper
+        than the mock.patch machinery for a module global."""
+        self.addCleanup(
+            setattr, deploy_stack, name, getattr(deploy_stack, name))
+        setattr(deploy_stack, name, mock_obj)
+        return mock_obj
+
+    def _deadline_clients(self):
+        """Return private (client, tear_down_client) template copies.
+
+        The pair shares one env, as the originals built per test did,
+        but each copy gets its own backend so deadlines and clocks can
+        be adjusted independently."""
+        template = self._deadline_client_template
+        client = copy.copy(template)
+        client.env = copy.copy(template.env)
+        client._backend = copy.copy(template._backend)
+        tear_down_client = copy.copy(client)
+        tear_down_client._backend = copy.copy(template._backend)
+        return client, tear_down_client
+
+    def bootstrapped_client(self):
+        """Return a private copy of the bootstrapped template client."""
+        return copy.deepcopy(self._bootstrapped_template)
+
+    def _make_bs(self, client, **kwargs):
+        """Build a BootstrapManager with the usual test defaults.
+
+        Tests mostly vary only the name, log_dir and tear_down_client;
+        everything else defaults to the values repeated throughout this
+        class."""
+        kwargs.setdefault('temp_env_name', 'foobar')
+        kwargs.setdefault('tear_down_client', client)
+        kwargs.setdefault('bootstrap_host', None)
+        kwargs.setdefault('machines', [])
+        kwargs.setdefault('series', None)
+        kwargs.setdefault('agent_url', None)
+        kwargs.setdefault('agent_stream', None)
+        kwargs.setdefault('region', None)
+        kwargs.setdefault('log_dir', client.env.juju_home)
+        kwargs.setdefault('keep_env', False)
+        return BootstrapManager(client=client, **kwargs)
+
     def test_from_args(self):
         deadline = datetime(2012, 11, 10, 9, 8, 7)
         args = Namespace(
@@ -1438,9 +1596,11 @@ class TestBootstrapManager(FakeHomeTestCase):
         self.assertEqual({}, bs_manager.known_hosts)
 
     def make_client(self):
-        client = MagicMock()
+        # The spec keeps attribute access from growing an open-ended tree
+        # of child mocks; only real ModelClient attributes are mocked.
+        client = MagicMock(spec=ModelClient)
         client.env = JujuData(
-            'foo', {'type': 'baz'}, use_context(self, temp_dir()))
+            'foo', {'type': 'baz'}, self._tmp())
         client.get_matching_agent_version.return_value = '3.14'
         client.get_cache_path.return_value = get_cache_path(
             client.env.juju_home)
@@ -1448,14 +1608,13 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     def test_bootstrap_context_calls_update_env(self):
         client = fake_juju_client()
-        client.env.juju_home = use_context(self, temp_dir())
-        ue_mock = use_context(
-            self, patch('deploy_stack.update_env', wraps=update_env))
-        wfp_mock = use_context(
-            self, patch('deploy_stack.wait_for_port', autospec=True))
-        bs_manager = BootstrapManager(
-            'bar', client, client, None,
-            [], 'wacky', 'url', 'devel', None, client.env.juju_home, False)
+        client.env.juju_home = self._tmp()
+        ue_mock = self._swap_module_attr(
+            'update_env', Mock(wraps=update_env))
+        wfp_mock = self._swap_module_attr('wait_for_port', Mock())
+        bs_manager = self._make_bs(
+            client, temp_env_name='bar', series='wacky', agent_url='url',
+            agent_stream='devel')
         bs_manager.known_hosts['0'] = 'bootstrap.example.org'
         with bs_manager.bootstrap_context([]):
             pass
@@ -1468,14 +1627,13 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     def test_bootstrap_context_calls_update_env_omit(self):
         client = fake_juju_client()
-        client.env.juju_home = use_context(self, temp_dir())
-        ue_mock = use_context(
-            self, patch('deploy_stack.update_env', wraps=update_env))
-        wfp_mock = use_context(
-            self, patch('deploy_stack.wait_for_port', autospec=True))
-        bs_manager = BootstrapManager(
-            'bar', client, client, None,
-            [], 'wacky', 'url', 'devel', None, client.env.juju_home, True)
+        client.env.juju_home = self._tmp()
+        ue_mock = self._swap_module_attr(
+            'update_env', Mock(wraps=update_env))
+        wfp_mock = self._swap_module_attr('wait_for_port', Mock())
+        bs_manager = self._make_bs(
+            client, temp_env_name='bar', series='wacky', agent_url='url',
+            agent_stream='devel', keep_env=True)
         bs_manager.known_hosts['0'] = 'bootstrap.example.org'
         with bs_manager.bootstrap_context(
                 [], omit_config={'bootstrap_host', 'series'}):
@@ -1487,9 +1645,7 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     def test_bootstrap_context_sets_has_controller(self):
         client = self.make_client()
-        bs_manager = BootstrapManager(
-            'foobar', client, client, None, [], None, None, None, None,
-            None, False)
+        bs_manager = self._make_bs(client, log_dir=None)
         with patch.object(client, 'kill_controller'):
             with bs_manager.bootstrap_context([]):
                 self.assertIsTrue(bs_manager.has_controller)
@@ -1497,49 +1653,55 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     def test_existing_bootstrap_context_sets_has_controller(self):
         client = self.make_client()
-        bs_manager = BootstrapManager(
-            'foobar', client, client, None, [], None, None, None, None,
-            None, False)
+        bs_manager = self._make_bs(client, log_dir=None)
         with patch.object(client, 'kill_controller'):
             with bs_manager.existing_bootstrap_context([]):
                 self.assertIsTrue(bs_manager.has_controller)
         self.assertIsTrue(bs_manager.has_controller)
 
+    @staticmethod
+    def _checked_side_effect(clients, result_factory=None):
+        """Return a side effect that runs under check_timeouts.
+
+        The soft-deadline tests only care that the checked call runs
+        inside each client's check_timeouts without raising; one factory
+        replaces the per-test do_check closures.  With clients=None the
+        checked client is the call's first positional argument."""
+        def do_check(*args, **kwargs):
+            for client in (args[:1] if clients is None else clients):
+                with client.check_timeouts():
+                    pass
+            if result_factory is not None:
+                return result_factory()
+        return do_check
+
     def test_handle_bootstrap_exceptions_ignores_soft_deadline(self):
-        env = JujuData('foo', {'type': 'nonlocal'})
-        client = ModelClient(env, None, None)
-        tear_down_client = ModelClient(env, None, None)
+        client, tear_down_client = self._deadline_clients()
         soft_deadline = datetime(2015, 1, 2, 3, 4, 6)
         now = soft_deadline + timedelta(seconds=1)
-        client.env.juju_home = use_context(self, temp_dir())
-        bs_manager = BootstrapManager(
-            'foobar', client, tear_down_client, None, [], None, None, None,
-            None, client.env.juju_home, False)
-
-        def do_check(*args, **kwargs):
-            with client.check_timeouts():
-                with tear_down_client.check_timeouts():
-                    return make_fake_juju_return()
-
-        with patch.object(bs_manager.tear_down_client, 'juju',
-                          side_effect=do_check, autospec=True):
-            with patch.object(client._backend, '_now', return_value=now):
-                fake_exception = Exception()
-                with self.assertRaises(LoggedException) as exc:
-                    with bs_manager.handle_bootstrap_exceptions():
-                        client._backend.soft_deadline = soft_deadline
-                        tear_down_client._backend.soft_deadline = soft_deadline
-                        raise fake_exception
-                self.assertIs(fake_exception, exc.exception.exception)
+        client.env.juju_home = self._tmp()
+        bs_manager = self._make_bs(
+            client, tear_down_client=tear_down_client)
+        # The clients are throwaway test objects, so plain attribute
+        # assignment replaces the patch.object bookkeeping.
+        bs_manager.tear_down_client.juju = Mock(
+            side_effect=self._checked_side_effect(
+                [client, tear_down_client], make_fake_juju_return))
+        client._backend._now = Mock(return_value=now)
+        fake_exception = Exception()
+        with self.assertRaises(LoggedException) as exc:
+            with bs_manager.handle_bootstrap_exceptions():
+                client._backend.soft_deadline = soft_deadline
+                tear_down_client._backend.soft_deadline = soft_deadline
+                raise fake_exception
+        self.assertIs(fake_exception, exc.exception.exception)
 
     def test_tear_down_requires_same_env(self):
         client = self.make_client()
         client.env.juju_home = 'foobar'
         tear_down_client = self.make_client()
         tear_down_client.env.juju_home = 'barfoo'
-        bs_manager = BootstrapManager(
-            'foobar', client, tear_down_client,
-            None, [], None, None, None, None, client.env.juju_home, False)
+        bs_manager = self._make_bs(client, tear_down_client=tear_down_client)
         with self.assertRaisesRegexp(AssertionError,
                                      'Tear down client needs same env'):
             with patch.object(client, 'destroy_controller',
@@ -1548,106 +1710,90 @@ class TestBootstrapManager(FakeHomeTestCase):
         self.assertEqual('barfoo', tear_down_client.env.juju_home)
         self.assertIsFalse(destroy_mock.called)
 
+    def assert_dumped_models(self, del_mock, log_dir):
+        """Check the dump_env_logs_known_hosts calls in one pass.
+
+        Each recorded call is projected to a hashable tuple keyed on the
+        model name, so a single Counter comparison replaces
+        assertItemsEqual's pairwise matching over unhashable call
+        objects while still catching duplicate calls."""
+        join = os.path.join
+        dumped = Counter(
+            (args[0].env.environment, args[1], args[2],
+             frozenset(args[3].items()))
+            for args, kwargs in del_mock.call_args_list)
+        self.assertEqual(
+            Counter([('name', join(log_dir, 'name'), None, frozenset()),
+                     ('controller', join(log_dir, 'controller'),
+                      'foo/models/cache.yaml', frozenset())]),
+            dumped)
+
     def test_dump_all_multi_model(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            with patch('deploy_stack.dump_env_logs_known_hosts') as del_mock:
-                with patch.object(bs_manager, '_should_dump',
-                                  return_value=True):
-                    bs_manager.dump_all_logs()
-
-        clients = dict((c[1][0].env.environment, c[1][0])
-                       for c in del_mock.mock_calls)
-        self.assertItemsEqual(
-            [call(client, os.path.join(log_dir, 'name'), None, {}),
-             call(clients['controller'], os.path.join(log_dir, 'controller'),
-                  'foo/models/cache.yaml', {})],
-            del_mock.mock_calls)
+        client = self.bootstrapped_client()
+        log_dir = self._tmp()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        with patch('deploy_stack.dump_env_logs_known_hosts',
+                   new_callable=Mock) as del_mock, \
+                patch.object(bs_manager, '_should_dump', return_value=True):
+            bs_manager.dump_all_logs()
+        self.assert_dumped_models(del_mock, log_dir)
 
     def test_dump_all_multi_model_iter_failure(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            with patch('deploy_stack.dump_env_logs_known_hosts') as del_mock:
-                with patch.object(client, 'iter_model_clients',
-                                  side_effect=Exception):
-                    with patch.object(bs_manager, '_should_dump',
-                                      return_value=True):
-                        bs_manager.dump_all_logs()
-
-        clients = dict((c[1][0].env.environment, c[1][0])
-                       for c in del_mock.mock_calls)
-
-        self.assertItemsEqual(
-            [call(client, os.path.join(log_dir, 'name'), None, {}),
-             call(clients['controller'], os.path.join(log_dir, 'controller'),
-                  'foo/models/cache.yaml', {})],
-            del_mock.mock_calls)
+        client = self.bootstrapped_client()
+        log_dir = self._tmp()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        with patch('deploy_stack.dump_env_logs_known_hosts',
+                   new_callable=Mock) as del_mock, \
+                patch.object(client, 'iter_model_clients',
+                             side_effect=Exception), \
+                patch.object(bs_manager, '_should_dump', return_value=True):
+            bs_manager.dump_all_logs()
+        self.assert_dumped_models(del_mock, log_dir)
 
     def test_dump_all_logs_ignores_soft_deadline(self):
-
-        def do_check(client, *args, **kwargs):
-            with client.check_timeouts():
-                pass
-
         client = fake_juju_client()
         client._backend._past_deadline = True
         client.bootstrap()
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            with patch.object(bs_manager, '_should_dump', return_value=True,
-                              autospec=True):
-                with patch('deploy_stack.dump_env_logs_known_hosts',
-                           side_effect=do_check, autospec=True):
-                    bs_manager.dump_all_logs()
+        log_dir = self._tmp()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        with patch.object(bs_manager, '_should_dump', return_value=True,
+                          autospec=True), \
+                patch('deploy_stack.dump_env_logs_known_hosts',
+                      side_effect=self._checked_side_effect(None)):
+            bs_manager.dump_all_logs()
 
     def test_runtime_context_raises_logged_exception(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        bs_manager = BootstrapManager(
-            'foobar', client, client,
-            None, [], None, None, None, None, client.env.juju_home, False)
+        client = self.bootstrapped_client()
+        bs_manager = self._make_bs(client)
         bs_manager.has_controller = True
         test_error = Exception("Some exception")
         test_error.output = "a stdout value"
         test_error.stderr = "a stderr value"
-        with patch.object(bs_manager, 'dump_all_logs', autospec=True):
-            with patch('deploy_stack.safe_print_status',
-                       autospec=True) as sp_mock:
-                with self.assertRaises(LoggedException) as err_ctx:
-                    with bs_manager.runtime_context([]):
-                        raise test_error
-                    self.assertIs(err_ctx.exception.exception, test_error)
+        bs_manager.dump_all_logs = Mock()
+        with patch('deploy_stack.safe_print_status',
+                   autospec=True) as sp_mock:
+            with self.assertRaises(LoggedException) as err_ctx:
+                with bs_manager.runtime_context([]):
+                    raise test_error
+                self.assertIs(err_ctx.exception.exception, test_error)
         self.assertIn("a stdout value", self.log_stream.getvalue())
         self.assertIn("a stderr value", self.log_stream.getvalue())
         sp_mock.assert_called_once_with(client)
 
     def test_runtime_context_raises_logged_exception_no_controller(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        bs_manager = BootstrapManager(
-            'foobar', client, client,
-            None, [], None, None, None, None, client.env.juju_home, False)
+        client = self.bootstrapped_client()
+        bs_manager = self._make_bs(client)
         bs_manager.has_controller = False
         test_error = Exception("Some exception")
         test_error.output = "a stdout value"
         test_error.stderr = "a stderr value"
-        with patch.object(bs_manager, 'dump_all_logs', autospec=True):
-            with patch('deploy_stack.safe_print_status',
-                       autospec=True) as sp_mock:
-                with self.assertRaises(LoggedException) as err_ctx:
-                    with bs_manager.runtime_context([]):
-                        raise test_error
-                    self.assertIs(err_ctx.exception.exception, test_error)
+        bs_manager.dump_all_logs = Mock()
+        with patch('deploy_stack.safe_print_status',
+                   autospec=True) as sp_mock:
+            with self.assertRaises(LoggedException) as err_ctx:
+                with bs_manager.runtime_context([]):
+                    raise test_error
+                self.assertIs(err_ctx.exception.exception, test_error)
         self.assertIn("a stdout value", self.log_stream.getvalue())
         self.assertIn("a stderr value", self.log_stream.getvalue())
         self.assertEqual(0, sp_mock.call_count)
@@ -1656,64 +1802,47 @@ class TestBootstrapManager(FakeHomeTestCase):
             self.log_stream.getvalue())
 
     def test_runtime_context_looks_up_host(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        bs_manager = BootstrapManager(
-            'foobar', client, client,
-            None, [], None, None, None, None, client.env.juju_home, False)
-        with patch.object(bs_manager, 'dump_all_logs', autospec=True):
-            with bs_manager.runtime_context([]):
-                self.assertEqual({
-                    '0': '0.example.com'}, bs_manager.known_hosts)
-
-    @patch('deploy_stack.dump_env_logs_known_hosts', autospec=True)
+        client = self.bootstrapped_client()
+        bs_manager = self._make_bs(client)
+        bs_manager.dump_all_logs = Mock()
+        with bs_manager.runtime_context([]):
+            self.assertEqual({
+                '0': '0.example.com'}, bs_manager.known_hosts)
+
+    @patch('deploy_stack.dump_env_logs_known_hosts')
     def test_runtime_context_addable_machines_no_known_hosts(self, del_mock):
-        client = fake_juju_client()
-        client.bootstrap()
-        bs_manager = BootstrapManager(
-            'foobar', client, client,
-            None, [], None, None, None, None, client.env.juju_home, False)
+        client = self.bootstrapped_client()
+        bs_manager = self._make_bs(client)
         bs_manager.known_hosts = {}
-        with patch.object(bs_manager.client, 'add_ssh_machines',
-                          autospec=True) as ads_mock:
-            with patch.object(bs_manager, 'dump_all_logs', autospec=True):
-                with bs_manager.runtime_context(['baz']):
-                    ads_mock.assert_called_once_with(['baz'])
+        ads_mock = bs_manager.client.add_ssh_machines = Mock()
+        bs_manager.dump_all_logs = Mock()
+        with bs_manager.runtime_context(['baz']):
+            ads_mock.assert_called_once_with(['baz'])
 
     @patch('deploy_stack.BootstrapManager.dump_all_logs', autospec=True)
     def test_runtime_context_addable_machines_with_known_hosts(self, dal_mock):
-        client = fake_juju_client()
-        client.bootstrap()
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            bs_manager.known_hosts['0'] = 'example.org'
-            with patch.object(bs_manager.client, 'add_ssh_machines',
-                              autospec=True) as ads_mock:
-                with bs_manager.runtime_context(['baz']):
-                    ads_mock.assert_called_once_with(['baz'])
+        client = self.bootstrapped_client()
+        log_dir = self._tmp()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        bs_manager.known_hosts['0'] = 'example.org'
+        ads_mock = bs_manager.client.add_ssh_machines = Mock()
+        with bs_manager.runtime_context(['baz']):
+            ads_mock.assert_called_once_with(['baz'])
 
     @contextmanager
     def no_controller_manager(self):
-        client = fake_juju_client()
-        client.bootstrap()
-        bs_manager = BootstrapManager(
-            'foobar', client, client,
-            None, [], None, None, None, None, self.juju_home, False)
+        client = self.bootstrapped_client()
+        bs_manager = self._make_bs(client, log_dir=self.juju_home)
         bs_manager.has_controller = False
+        juju_mock = client.juju = Mock(
+            return_value=make_fake_juju_return())
+        gjo_mock = client.get_juju_output = Mock(
+            wraps=client.get_juju_output)
+        bs_manager._should_dump = Mock(return_value=True)
         with patch('deploy_stack.safe_print_status',
-                   autospec=True) as sp_mock:
-            with patch.object(
-                    client, 'juju', wrap=client.juju,
-                    return_value=make_fake_juju_return()) as juju_mock:
-                with patch.object(client, 'get_juju_output',
-                                  wraps=client.get_juju_output) as gjo_mock:
-                    with patch.object(bs_manager, '_should_dump',
-                                      return_value=True, autospec=True):
-                        with patch('deploy_stack.get_remote_machines',
-                                   return_value={}):
-                                yield bs_manager
+                   autospec=True) as sp_mock, \
+                patch('deploy_stack.get_remote_machines', return_value={}):
+            yield bs_manager
         self.assertEqual(sp_mock.call_count, 0)
         self.assertEqual(0, gjo_mock.call_count)
         juju_mock.assert_called_once_with(
@@ -1734,44 +1863,38 @@ class TestBootstrapManager(FakeHomeTestCase):
     @contextmanager
     def logged_exception_bs_manager(self):
         client = fake_juju_client()
-        with temp_dir() as root:
-            log_dir = os.path.join(root, 'log-dir')
-            os.mkdir(log_dir)
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            juju_home = os.path.join(root, 'juju-home')
-            os.mkdir(juju_home)
-            client.env.juju_home = juju_home
-            yield bs_manager
+        log_dir, juju_home = self._cloned_layout()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        client.env.juju_home = juju_home
+        yield bs_manager
 
     def test_booted_context_handles_logged_exception(self):
         with self.logged_exception_bs_manager() as bs_manager:
+            bs_manager.dump_all_logs = Mock()
             with self.assertRaises(SystemExit):
-                with patch.object(bs_manager, 'dump_all_logs'):
-                    with bs_manager.booted_context(False):
-                        raise LoggedException()
+                with bs_manager.booted_context(False):
+                    raise LoggedException()
 
     def test_booted_context_raises_logged_exception(self):
         with self.logged_exception_bs_manager() as bs_manager:
             bs_manager.logged_exception_exit = False
+            bs_manager.dump_all_logs = Mock()
             with self.assertRaises(LoggedException):
-                with patch.object(bs_manager, 'dump_all_logs'):
-                    with bs_manager.booted_context(False):
-                        raise LoggedException()
+                with bs_manager.booted_context(False):
+                    raise LoggedException()
 
     def test_booted_context_omits_supported(self):
         client = fake_juju_client()
-        client.env.juju_home = use_context(self, temp_dir())
+        client.env.juju_home = self._tmp()
         client.bootstrap_replaces = {'agent-version', 'series',
                                      'bootstrap-host', 'agent-stream'}
-        ue_mock = use_context(
-            self, patch('deploy_stack.update_env', wraps=update_env))
-        wfp_mock = use_context(
-            self, patch('deploy_stack.wait_for_port', autospec=True))
-        bs_manager = BootstrapManager(
-            'bar', client, client, 'bootstrap.example.org',
-            [], 'wacky', 'url', 'devel', None, client.env.juju_home, False)
+        ue_mock = self._swap_module_attr(
+            'update_env', Mock(wraps=update_env))
+        wfp_mock = self._swap_module_attr('wait_for_port', Mock())
+        bs_manager = self._make_bs(
+            client, temp_env_name='bar',
+            bootstrap_host='bootstrap.example.org', series='wacky',
+            agent_url='url', agent_stream='devel')
         with patch.object(bs_manager, 'runtime_context'):
             with bs_manager.booted_context([]):
                 pass
@@ -1790,100 +1913,77 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     @contextmanager
     def booted_to_bootstrap(self, bs_manager):
-        """Preform patches to focus on the call to bootstrap."""
-        with patch.object(bs_manager, 'dump_all_logs'):
-            with patch.object(bs_manager, 'runtime_context'):
-                with patch.object(
-                        bs_manager.client, 'juju',
-                        return_value=make_fake_juju_return()):
-                    with patch.object(bs_manager.client, 'bootstrap') as mock:
-                        yield mock
+        """Swap in stubs to focus on the call to bootstrap."""
+        with _swap(bs_manager, 'dump_all_logs', Mock()), \
+                _swap(bs_manager, 'runtime_context', MagicMock()), \
+                _swap(bs_manager.client, 'juju',
+                      Mock(return_value=make_fake_juju_return())), \
+                _swap(bs_manager.client, 'bootstrap', Mock()) as mock:
+            yield mock
 
     def test_booted_context_kwargs(self):
         client = fake_juju_client()
-        with temp_dir() as root:
-            log_dir = os.path.join(root, 'log-dir')
-            os.mkdir(log_dir)
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            juju_home = os.path.join(root, 'juju-home')
-            os.mkdir(juju_home)
-            client.env.juju_home = juju_home
-            with self.booted_to_bootstrap(bs_manager) as bootstrap_mock:
-                with bs_manager.booted_context(False, to='test'):
-                    bootstrap_mock.assert_called_once_with(
-                        upload_tools=False, to='test', bootstrap_series=None)
-            with self.booted_to_bootstrap(bs_manager) as bootstrap_mock:
-                with bs_manager.existing_booted_context(False, to='test'):
-                    bootstrap_mock.assert_called_once_with(
-                        upload_tools=False, to='test', bootstrap_series=None)
+        log_dir, juju_home = self._cloned_layout()
+        bs_manager = self._make_bs(client, log_dir=log_dir)
+        client.env.juju_home = juju_home
+        with self.booted_to_bootstrap(bs_manager) as bootstrap_mock:
+            with bs_manager.booted_context(False, to='test'):
+                bootstrap_mock.assert_called_once_with(
+                    upload_tools=False, to='test', bootstrap_series=None)
+        with self.booted_to_bootstrap(bs_manager) as bootstrap_mock:
+            with bs_manager.existing_booted_context(False, to='test'):
+                bootstrap_mock.assert_called_once_with(
+                    upload_tools=False, to='test', bootstrap_series=None)
 
     def test_runtime_context_teardown_ignores_soft_deadline(self):
-        env = JujuData('foo', {'type': 'nonlocal'})
+        client, tear_down_client = self._deadline_clients()
         soft_deadline = datetime(2015, 1, 2, 3, 4, 6)
         now = soft_deadline + timedelta(seconds=1)
-        client = ModelClient(env, None, None)
-        tear_down_client = ModelClient(env, None, None)
-
-        def do_check_client(*args, **kwargs):
-            with client.check_timeouts():
-                return iter([])
-
-        def do_check_teardown_client(*args, **kwargs):
-            with tear_down_client.check_timeouts():
-                return iter([])
-
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, tear_down_client,
-                None, [], None, None, None, None, log_dir, False)
-            bs_manager.known_hosts['0'] = 'example.org'
-            with patch.object(bs_manager.client, 'juju',
-                              side_effect=do_check_client, autospec=True):
-                with patch.object(bs_manager.client, 'iter_model_clients',
-                                  side_effect=do_check_client, autospec=True,
-                                  ):
-                    with patch.object(bs_manager, 'tear_down',
-                                      do_check_teardown_client):
-                        with patch.object(client._backend, '_now',
-                                          return_value=now):
-                            with bs_manager.runtime_context(['baz']):
-                                client._backend.soft_deadline = soft_deadline
-                                td_backend = tear_down_client._backend
-                                td_backend.soft_deadline = soft_deadline
 
-    @contextmanager
+        do_check_client = self._checked_side_effect([client], tuple)
+        log_dir = self._tmp()
+        bs_manager = self._make_bs(
+            client, tear_down_client=tear_down_client, log_dir=log_dir)
+        bs_manager.known_hosts['0'] = 'example.org'
+        bs_manager.client.juju = Mock(side_effect=do_check_client)
+        bs_manager.client.iter_model_clients = Mock(
+            side_effect=do_check_client)
+        bs_manager.tear_down = self._checked_side_effect(
+            [tear_down_client], tuple)
+        client._backend._now = Mock(return_value=now)
+        with bs_manager.runtime_context(['baz']):
+            client._backend.soft_deadline = soft_deadline
+            td_backend = tear_down_client._backend
+            td_backend.soft_deadline = soft_deadline
+
     def make_bootstrap_manager(self):
+        # A plain factory: nothing here needs the generator/context
+        # machinery, and the callers hold no cleanup obligations.
         client = fake_juju_client()
-        with temp_dir() as log_dir:
-            bs_manager = BootstrapManager(
-                'foobar', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            yield bs_manager
+        log_dir = self._tmp()
+        return self._make_bs(client, log_dir=log_dir)
 
     def test_top_context_dumps_timings(self):
-        with self.make_bootstrap_manager() as bs_manager:
-            with patch('deploy_stack.dump_juju_timings') as djt_mock:
-                with bs_manager.top_context():
-                    pass
-        djt_mock.assert_called_once_with(bs_manager.client, bs_manager.log_dir)
+        bs_manager = self.make_bootstrap_manager()
+        with bs_manager.top_context():
+            pass
+        self.djt_mock.assert_called_once_with(
+            bs_manager.client, bs_manager.log_dir)
 
     def test_top_context_dumps_timings_on_exception(self):
-        with self.make_bootstrap_manager() as bs_manager:
-            with patch('deploy_stack.dump_juju_timings') as djt_mock:
-                with self.assertRaises(ValueError):
-                    with bs_manager.top_context():
-                        raise ValueError
-        djt_mock.assert_called_once_with(bs_manager.client, bs_manager.log_dir)
+        bs_manager = self.make_bootstrap_manager()
+        with self.assertRaises(ValueError):
+            with bs_manager.top_context():
+                raise ValueError
+        self.djt_mock.assert_called_once_with(
+            bs_manager.client, bs_manager.log_dir)
 
     def test_top_context_no_log_dir_skips_timings(self):
-        with self.make_bootstrap_manager() as bs_manager:
-            bs_manager.log_dir = None
-            with patch('deploy_stack.dump_juju_timings') as djt_mock:
-                with bs_manager.top_context():
-                    pass
-        self.assertEqual(djt_mock.call_count, 0)
+        bs_manager = self.make_bootstrap_manager()
+        bs_manager.log_dir = None
+        with bs_manager.top_context():
+            pass
+        self.assertEqual(self.djt_mock.call_count, 0)
 
     def test_collect_resource_details_collects_expected_details(self):
         controller_uuid = 'eb67e1eb-6c54-45f5-8b6a-b6243be97202'
@@ -1894,9 +1994,7 @@ class TestBootstrapManager(FakeHomeTestCase):
                           'instance-id': 'juju-dddd-machine-1'}),
         ]
         client = fake_juju_client()
-        bs_manager = BootstrapManager(
-            'foobar', client, client, None, [], None, None, None, None,
-            client.env.juju_home, False)
+        bs_manager = self._make_bs(client)
         result = {
             'controller-uuid': controller_uuid,
             'instances': [(m.info['instance-id'], m.info['dns-name'])
@@ -1912,297 +2010,295 @@ class TestBootstrapManager(FakeHomeTestCase):
 
     def test_ensure_cleanup(self):
         client = fake_juju_client()
-        with temp_dir() as root:
-            log_dir = os.path.join(root, 'log-dir')
-            os.mkdir(log_dir)
-            bs_manager = BootstrapManager(
-                'controller', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            mock_substrate = Mock()
-            mock_details = {}
-            with patch('deploy_stack.make_substrate_manager', autospec=True)\
-                    as msm:
-                msm.return_value.__enter__.return_value = mock_substrate
-                bs_manager.resource_details = mock_details
-                bs_manager.ensure_cleanup()
-            mock_substrate.ensure_cleanup.assert_called_once_with(
-                mock_details)
-            msm.assert_called_once_with(client.env)
+        log_dir = self._cloned_layout()[0]
+        bs_manager = self._make_bs(
+            client, temp_env_name='controller', log_dir=log_dir)
+        mock_substrate = Mock()
+        mock_details = {}
+        with patch('deploy_stack.make_substrate_manager', autospec=True)\
+                as msm:
+            msm.return_value.__enter__.return_value = mock_substrate
+            bs_manager.resource_details = mock_details
+            bs_manager.ensure_cleanup()
+        mock_substrate.ensure_cleanup.assert_called_once_with(
+            mock_details)
+        msm.assert_called_once_with(client.env)
 
     def test_ensure_cleanup_resource_details_empty(self):
         client = fake_juju_client()
-        with temp_dir() as root:
-            log_dir = os.path.join(root, 'log-dir')
-            os.mkdir(log_dir)
-            bs_manager = BootstrapManager(
-                'controller', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            with patch('deploy_stack.make_substrate_manager', autospec=True) \
-                    as msm:
-                rl = bs_manager.ensure_cleanup()
-                self.assertEquals(0, msm.call_count)
-                self.assertEquals(rl, [])
+        log_dir = self._cloned_layout()[0]
+        bs_manager = self._make_bs(
+            client, temp_env_name='controller', log_dir=log_dir)
+        with patch('deploy_stack.make_substrate_manager', autospec=True) \
+                as msm:
+            rl = bs_manager.ensure_cleanup()
+            self.assertEquals(0, msm.call_count)
+            self.assertEquals(rl, [])
 
     def test_ensure_cleanup_substrate_none(self):
         client = fake_juju_client()
-        with temp_dir() as root:
-            log_dir = os.path.join(root, 'log-dir')
-            os.mkdir(log_dir)
-            bs_manager = BootstrapManager(
-                'controller', client, client,
-                None, [], None, None, None, None, log_dir, False)
-            mock_details = {}
-            bs_manager.resource_details = mock_details
-            with patch('deploy_stack.make_substrate_manager', autospec=True)\
-                    as msm:
-                msm.return_value.__enter__.return_value = None
-                rl = bs_manager.ensure_cleanup()
-                self.assertIn("foo is an unknown provider."
-                              " Unable to ensure cleanup",
-                              self.log_stream.getvalue())
-                self.assertEquals(rl, [])
+        log_dir = self._cloned_layout()[0]
+        bs_manager = self._make_bs(
+            client, temp_env_name='controller', log_dir=log_dir)
+        mock_details = {}
+        bs_manager.resource_details = mock_details
+        with patch('deploy_stack.make_substrate_manager', autospec=True)\
+                as msm:
+            msm.return_value.__enter__.return_value = None
+            rl = bs_manager.ensure_cleanup()
+            self.assertIn("foo is an unknown provider."
+                          " Unable to ensure cleanup",
+                          self.log_stream.getvalue())
+            self.assertEquals(rl, [])
+
+
+class _FakeBootstrapException(Exception):
+    """A sentry exception to be raised by bootstrap."""
 
 
 class TestBootContext(FakeHomeTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestBootContext, cls).setUpClass()
+        # These module-level patches are identical for every test in the
+        # class; start them once and reset the mocks per test in setUp.
+        # No autospec: these are asserted by call count alone, so the
+        # signature inspection would be wasted work.
+        cls._class_patchers = [
+            patch('deploy_stack.BootstrapManager.dump_all_logs'),
+            patch('deploy_stack.BootstrapManager.collect_resource_details'),
+            patch('deploy_stack.BootstrapManager.tear_down'),
+            patch('subprocess.Popen', return_value=_FAKE_POPEN_KC),
+            patch('subprocess.check_call'),
+            ]
+        cls._class_mocks = [patcher.start() for patcher in cls._class_patchers]
+        (cls.dal_mock, cls.crd_mock, cls.tear_down_mock,
+         cls.po_mock, cls.cc_mock) = cls._class_mocks
+        # No test here inspects the wait_for_port or get_machine_dns_name
+        # calls, so plain stubs swapped in at module level beat mocks;
+        # restored in tearDownClass.
+        cls._stubbed_attrs = [
+            (name, getattr(deploy_stack, name))
+            for name in ('wait_for_port', 'get_machine_dns_name')]
+        deploy_stack.wait_for_port = lambda *args, **kwargs: None
+        deploy_stack.get_machine_dns_name = lambda *args, **kwargs: 'foo'
+        # Client templates; tests take private copies via _fresh_client
+        # rather than reconstructing near-identical clients.
+        cls._client_123 = ModelClient(
+            JujuData('foo', {'type': 'paas', 'region': 'qux'}), '1.23',
+            'path')
+        cls._client_23 = ModelClient(
+            JujuData('foo', {'type': 'paas', 'region': 'qux'}), '2.3', 'path')
+        cls._client_paas = ModelClient(
+            JujuData('foo', {'type': 'paas'}), '1.23', 'path')
+        # Expose the config tempfile the boot path writes, as
+        # observable_temp_file does, but with the patch started once for
+        # the class.  A real file per boot run is unavoidable since
+        # temp_yaml_file writes and then unlinks it by name.
+
+        @contextmanager
+        def _observe_config_file(*args, **kwargs):
+            cls._config_file = tempfile.NamedTemporaryFile(delete=False)
+            try:
+                yield cls._config_file
+            finally:
+                cls._config_file.close()
+
+        cls._ntf_patcher = patch(
+            'jujupy.utility.NamedTemporaryFile',
+            side_effect=_observe_config_file)
+        cls._ntf_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._ntf_patcher.stop()
+        for name, original in cls._stubbed_attrs:
+            setattr(deploy_stack, name, original)
+        for patcher in cls._class_patchers:
+            patcher.stop()
+        super(TestBootContext, cls).tearDownClass()
+
+    # Patches every test wants; the patch objects are reusable, so they
+    # are built once here and started per test in setUp.  The deploy_stack
+    # symbols share one patch.multiple so the module is resolved once.
+    ds_cxt = patch.multiple(
+        'deploy_stack', copy_remote_logs=DEFAULT, archive_logs=DEFAULT)
+    le_cxt = patch('logging.exception')
+
     def setUp(self):
         super(TestBootContext, self).setUp()
         self.addContext(patch('sys.stdout'))
+        ds_mocks = self.addContext(self.ds_cxt)
+        self.crl_mock = ds_mocks['copy_remote_logs']
+        self.al_mock = ds_mocks['archive_logs']
+        self.le_mock = self.addContext(self.le_cxt)
+        # Only call records need clearing; the configured return values
+        # are part of the shared fixture.
+        for mock in self._class_mocks:
+            mock.reset_mock()
+        # reset_mock does not clear side effects, and
+        # test_status_error_raises installs one on the shared check_call.
+        self.cc_mock.side_effect = None
+
+    def _fresh_client(self, template):
+        """Return a private copy of a class-level template client.
+
+        env is deep-copied because boot_context mutates the config in
+        the region and update_env paths; the backend copy keeps timing
+        state from leaking between tests."""
+        client = copy.copy(template)
+        client.env = copy.deepcopy(template.env)
+        client._backend = copy.copy(template._backend)
+        return client
+
+    # Built once; bc_context hands each client a shallow copy.
+    _MODELS = ({'name': 'controller'}, {'name': 'bar'})
 
     @contextmanager
     def bc_context(self, client, log_dir=None, keep_env=False):
-        dal_mock = self.addContext(
-            patch('deploy_stack.BootstrapManager.dump_all_logs'))
-        self.addContext(patch('deploy_stack.get_machine_dns_name',
-                              return_value='foo', autospec=True))
-        self.addContext(patch(
-            'deploy_stack.BootstrapManager.collect_resource_details',
-            autospec=True))
-        models = [{'name': 'controller'}, {'name': 'bar'}]
-        self.addContext(patch.object(client, '_get_models',
-                                     return_value=models, autospec=True))
-        po_count = 0
-        with patch('subprocess.Popen', autospec=True,
-                   return_value=FakePopen(
-                       'kill-controller', '', 0)) as po_mock:
-            with patch('deploy_stack.BootstrapManager.tear_down',
-                       autospec=True) as tear_down_mock:
-                with patch.object(client, 'kill_controller',
-                                  autospec=True) as kill_mock:
-                    yield
-        self.assertEqual(po_count, po_mock.call_count)
-        dal_mock.assert_called_once_with()
+        client._get_models = Mock(return_value=list(self._MODELS))
+        with _swap(client, 'kill_controller', Mock()) as kill_mock:
+            yield
+        self.assertEqual(0, self.po_mock.call_count)
+        self.dal_mock.assert_called_once_with()
         tear_down_count = 0 if keep_env else 1
         self.assertEqual(1, kill_mock.call_count)
-        self.assertEqual(tear_down_count, tear_down_mock.call_count)
+        self.assertEqual(tear_down_count, self.tear_down_mock.call_count)
+
+    def assert_boot_calls(self, cc_mock, config_file):
+        """Check the whole boot command sequence with one list equality.
+
+        A single comparison of the positional args replaces five indexed
+        assert_juju_call checks walking mock_calls one at a time."""
+        expected = [_BOOTSTRAP_PREFIX + (config_file.name,) +
+                    _BOOTSTRAP_SUFFIX] + _POST_BOOTSTRAP_CALLS
+        self.assertEqual(
+            expected,
+            [args[0] for args, kwargs in cc_mock.call_args_list[:5]])
+
+    def _run_boot(self, client, log_dir=None, keep_env=False,
+                  upload_tools=False, region=None):
+        """Run boot_context under bc_context with the stock arguments.
+
+        The fixed-arg tests share this entry path and only vary the few
+        keywords; returns the observed config file for command checks."""
+        with self.bc_context(client, log_dir, keep_env=keep_env):
+            with boot_context('bar', client, None, [], None, None, None,
+                              log_dir, keep_env=keep_env,
+                              upload_tools=upload_tools, region=region):
+                pass
+        return self._config_file
 
     def test_bootstrap_context(self):
-        cc_mock = self.addContext(patch('subprocess.check_call'))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas', 'region': 'qux'}), '1.23', 'path')
-        with self.bc_context(client, 'log_dir'):
-            with observable_temp_file() as config_file:
-                with boot_context('bar', client, None, [], None, None, None,
-                                  'log_dir', keep_env=False,
-                                  upload_tools=False):
-                    pass
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'bootstrap', '--constraints',
-            'mem=2G', 'paas/qux', 'bar', '--config', config_file.name,
-            '--default-model', 'bar', '--agent-version', '1.23'), 0)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-controllers'), 1)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-models', '-c', 'bar'), 2)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:controller',
-            '--format', 'yaml'), 3)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:bar',
-            '--format', 'yaml'), 4)
-
-    def test_keep_env(self):
-        cc_mock = self.addContext(patch('subprocess.check_call'))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas', 'region': 'qux'}), '1.23', 'path')
-        with self.bc_context(client, keep_env=True):
-            with observable_temp_file() as config_file:
-                with boot_context('bar', client, None, [], None, None, None,
-                                  None, keep_env=True, upload_tools=False):
-                    pass
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'bootstrap', '--constraints',
-            'mem=2G', 'paas/qux', 'bar', '--config', config_file.name,
-            '--default-model', 'bar', '--agent-version', '1.23'), 0)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-controllers'), 1)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-models', '-c', 'bar'), 2)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:controller',
-            '--format', 'yaml'), 3)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:bar',
-            '--format', 'yaml'), 4)
+        # The keep_env variant only flips the tear-down expectation, so
+        # both scenarios run here rather than as near-identical tests.
+        for log_dir, keep_env in (('log_dir', False), (None, True)):
+            client = self._fresh_client(self._client_123)
+            config_file = self._run_boot(client, log_dir, keep_env=keep_env)
+            self.assert_boot_calls(self.cc_mock, config_file)
+            for mock in self._class_mocks:
+                mock.reset_mock()
 
     def test_upload_tools(self):
-        cc_mock = self.addContext(patch('subprocess.check_call'))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas', 'region': 'qux'}), '1.23', 'path')
-        with self.bc_context(client):
-            with observable_temp_file() as config_file:
-                with boot_context('bar', client, None, [], None, None, None,
-                                  None, keep_env=False, upload_tools=True):
-                    pass
-        assert_juju_call(self, cc_mock, client, (
+        client = self._fresh_client(self._client_123)
+        config_file = self._run_boot(client, upload_tools=True)
+        assert_juju_call(self, self.cc_mock, client, (
             'path', '--show-log', 'bootstrap', '--upload-tools',
             '--constraints', 'mem=2G', 'paas/qux', 'bar', '--config',
             config_file.name, '--default-model', 'bar'), 0)
 
     def test_calls_update_env(self):
-        cc_mock = self.addContext(patch('subprocess.check_call'))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas', 'region': 'qux'}), '2.3', 'path')
-        ue_mock = self.addContext(
-            patch('deploy_stack.update_env', wraps=update_env))
+        client = self._fresh_client(self._client_23)
+        # Only the rename matters downstream (the bootstrap command uses
+        # the model name); skip the rest of the real update_env body.
+        ue_mock = self.addContext(patch(
+            'deploy_stack.update_env',
+            side_effect=lambda env, name, **kw: env.set_model_name(name)))
         with self.bc_context(client):
-            with observable_temp_file() as config_file:
-                with boot_context('bar', client, None, [], 'wacky', 'url',
-                                  'devel', None, keep_env=False,
-                                  upload_tools=False):
-                    pass
+            with boot_context('bar', client, None, [], 'wacky', 'url',
+                              'devel', None, keep_env=False,
+                              upload_tools=False):
+                pass
+        config_file = self._config_file
         ue_mock.assert_called_with(
             client.env, 'bar', agent_url='url', agent_stream='devel',
             series='wacky', bootstrap_host=None, region=None)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'bootstrap', '--constraints', 'mem=2G',
-            'paas/qux', 'bar', '--config', config_file.name,
-            '--default-model', 'bar', '--agent-version', '2.3',
-            '--bootstrap-series', 'wacky'), 0)
+        assert_juju_call(
+            self, self.cc_mock, client,
+            _BOOTSTRAP_PREFIX + (config_file.name, '--default-model', 'bar',
+                                 '--agent-version', '2.3',
+                                 '--bootstrap-series', 'wacky'), 0)
 
     def test_with_bootstrap_failure(self):
-
-        class FakeException(Exception):
-            """A sentry exception to be raised by bootstrap."""
-
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas'}), '1.23', 'path')
-        self.addContext(patch('deploy_stack.get_machine_dns_name',
-                              return_value='foo'))
-        self.addContext(patch('subprocess.check_call'))
-        tear_down_mock = self.addContext(
-            patch('deploy_stack.BootstrapManager.tear_down', autospec=True))
+        client = self._fresh_client(self._client_paas)
         kill_mock = self.addContext(
-            patch('jujupy.ModelClient.kill_controller', autospec=True))
+            patch('jujupy.ModelClient.kill_controller'))
         po_mock = self.addContext(patch(
-            'subprocess.Popen', autospec=True,
-            return_value=FakePopen('kill-controller', '', 0)))
-        self.addContext(patch('deploy_stack.wait_for_port'))
-        fake_exception = FakeException()
-        self.addContext(patch.object(client, 'bootstrap',
-                                     side_effect=fake_exception))
-        crl_mock = self.addContext(patch('deploy_stack.copy_remote_logs'))
-        al_mock = self.addContext(patch('deploy_stack.archive_logs'))
-        le_mock = self.addContext(patch('logging.exception'))
+            'subprocess.Popen', return_value=_FAKE_POPEN_KC))
+        fake_exception = _FakeBootstrapException()
+        # The client is a private copy, so no unpatching is needed.
+        client.bootstrap = Mock(side_effect=fake_exception)
         with self.assertRaises(SystemExit):
             with boot_context('bar', client, 'baz', [], None, None, None,
                               'log_dir', keep_env=False, upload_tools=True):
                 pass
-        le_mock.assert_called_once_with(fake_exception)
-        self.assertEqual(crl_mock.call_count, 1)
-        call_args = crl_mock.call_args[0]
-        self.assertIsInstance(call_args[0], _Remote)
-        self.assertEqual(call_args[0].get_address(), 'baz')
-        self.assertEqual(call_args[1], 'log_dir')
-        al_mock.assert_called_once_with('log_dir')
-        self.assertEqual(0, tear_down_mock.call_count)
+        self.le_mock.assert_called_once_with(fake_exception)
+        self.assertEqual(self.crl_mock.call_count, 1)
+        remote, log_dir = self.crl_mock.call_args[0]
+        self.assertIsInstance(remote, _Remote)
+        self.assertEqual(remote.get_address(), 'baz')
+        self.assertEqual(log_dir, 'log_dir')
+        self.al_mock.assert_called_once_with('log_dir')
+        self.assertEqual(0, self.tear_down_mock.call_count)
         self.assertEqual(2, kill_mock.call_count)
         self.assertEqual(0, po_mock.call_count)
 
     def test_region(self):
-        self.addContext(patch('subprocess.check_call', autospec=True))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas'}), '1.23', 'path')
-        with self.bc_context(client, 'log_dir'):
-            with boot_context('bar', client, None, [], None, None, None,
-                              'log_dir', keep_env=False, upload_tools=False,
-                              region='steve'):
-                pass
+        client = self._fresh_client(self._client_paas)
+        self._run_boot(client, 'log_dir', region='steve')
         self.assertEqual('steve', client.env.get_region())
 
     def test_status_error_raises(self):
         """An error on final show-status propagates so an assess will fail."""
         error = subprocess.CalledProcessError(1, ['juju'], '')
         effects = [None, None, None, None, None, None, error]
-        cc_mock = self.addContext(patch('subprocess.check_call', autospec=True,
-                                        side_effect=effects))
-        client = ModelClient(JujuData(
-            'foo', {'type': 'paas', 'region': 'qux'}), '1.23', 'path')
+        self.cc_mock.side_effect = effects
+        client = self._fresh_client(self._client_123)
         with self.bc_context(client, 'log_dir'):
-            with observable_temp_file() as config_file:
-                with self.assertRaises(subprocess.CalledProcessError) as ctx:
-                    with boot_context('bar', client, None, [], None, None,
-                                      None, 'log_dir', keep_env=False,
-                                      upload_tools=False):
-                        pass
-                self.assertIs(ctx.exception, error)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'bootstrap', '--constraints',
-            'mem=2G', 'paas/qux', 'bar', '--config', config_file.name,
-            '--default-model', 'bar', '--agent-version', '1.23'), 0)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-controllers'), 1)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'list-models', '-c', 'bar'), 2)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:controller',
-            '--format', 'yaml'), 3)
-        assert_juju_call(self, cc_mock, client, (
-            'path', '--show-log', 'show-status', '-m', 'bar:bar',
-            '--format', 'yaml'), 4)
+            with self.assertRaises(subprocess.CalledProcessError) as ctx:
+                with boot_context('bar', client, None, [], None, None,
+                                  None, 'log_dir', keep_env=False,
+                                  upload_tools=False):
+                    pass
+            self.assertIs(ctx.exception, error)
+        self.assert_boot_calls(self.cc_mock, self._config_file)
 
 
 class TestDeployJobParseArgs(FakeHomeTestCase):
 
+    def expected_args(self, **overrides):
+        """The default parse result with the given fields overridden."""
+        return Namespace(**dict(vars(_DEFAULT_PARSED_ARGS), **overrides))
+
     def test_deploy_job_parse_args(self):
         args = deploy_job_parse_args(['foo', 'bar/juju', 'baz', 'qux'])
-        self.assertEqual(args, Namespace(
-            agent_stream=None,
-            agent_url=None,
-            bootstrap_host=None,
-            debug=False,
-            env='foo',
-            temp_env_name='qux',
-            keep_env=False,
-            logs='baz',
-            machine=[],
-            juju_bin='bar/juju',
-            series=None,
-            upgrade=False,
-            verbose=logging.INFO,
-            upload_tools=False,
-            region=None,
-            to=None,
-            deadline=None,
-            controller_host=None,
-            use_charmstore=False,
-            existing=None
-        ))
+        self.assertEqual(args, _DEFAULT_PARSED_ARGS)
 
     def test_upload_tools(self):
         args = deploy_job_parse_args(
             ['foo', 'bar/juju', 'baz', 'qux', '--upload-tools'])
-        self.assertEqual(args.upload_tools, True)
+        self.assertEqual(args, self.expected_args(upload_tools=True))
 
     def test_agent_stream(self):
         args = deploy_job_parse_args(
             ['foo', 'bar/juju', 'baz', 'qux', '--agent-stream', 'wacky'])
-        self.assertEqual('wacky', args.agent_stream)
+        self.assertEqual(args, self.expected_args(agent_stream='wacky'))
 
     def test_use_charmstore(self):
         args = deploy_job_parse_args(
             ['foo', 'bar/juju', 'baz', 'qux', '--use-charmstore'])
-        self.assertIs(args.use_charmstore, True)
+        self.assertEqual(args, self.expected_args(use_charmstore=True))
 
 
 class TestWaitForStateServerToShutdown(FakeHomeTestCase):
@@ -2217,10 +2313,10 @@ class TestWaitForStateServerToShutdown(FakeHomeTestCase):
             'auth-url': 'http://example.org',
             }, self.juju_home)
         client = fake_juju_client(env=env)
-        with patch('deploy_stack.wait_for_port', autospec=True) as wfp_mock:
-            with patch('deploy_stack.has_nova_instance', autospec=True,
+        with patch('deploy_stack.wait_for_port') as wfp_mock:
+            with patch('deploy_stack.has_nova_instance',
                        return_value=False) as hni_mock:
-                with patch('deploy_stack.print_now', autospec=True) as pn_mock:
+                with patch('deploy_stack.print_now') as pn_mock:
                     wait_for_state_server_to_shutdown(
                         'example.org', client, 'i-255')
         self.assertEqual(pn_mock.mock_calls, [